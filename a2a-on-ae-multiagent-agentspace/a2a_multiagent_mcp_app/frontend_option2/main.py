@@ -15,8 +15,8 @@
 
 """This module contains the frontend for the A2A multi-agent application."""
 import asyncio
+import logging
 import os
-import traceback
 from collections.abc import AsyncIterator
 
 import gradio as gr
@@ -27,6 +27,12 @@ from google.adk.sessions import InMemorySessionService
 from google.genai import types
 from vertexai import agent_engines
 
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
 load_dotenv()
 
 APP_NAME = "routing_app"
@@ -39,6 +45,9 @@ AGENT_ENGINE_ID = os.getenv("AGENT_ENGINE_ID")
 LOCATION = os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1")
 PROJECT_NUMBER = os.getenv("PROJECT_NUMBER")
 
+# Minimum time between chat UI updates while streaming, in seconds.
+STREAM_FLUSH_INTERVAL = 0.05
+
 resource_name = f"projects/{PROJECT_NUMBER}/locations/us-central1/reasoningEngines/{AGENT_ENGINE_ID}"
 
 remote_agent = agent_engines.get(resource_name)
@@ -50,6 +59,10 @@ async def get_response_from_agent(
 ) -> AsyncIterator[gr.ChatMessage]:
     """Get response from host agent."""
     try:
+        loop = asyncio.get_running_loop()
+        last_flush = 0.0
+        pending_text = None
+
         remote_session = await remote_agent.async_create_session(user_id="user1")
         async for event in remote_agent.async_stream_query(
             user_id="user1",
@@ -59,11 +72,23 @@ async def get_response_from_agent(
             if event["content"] and event["content"]["parts"]:
                 for part in event["content"]["parts"]:
                     if part.get("text"):
-                        yield gr.ChatMessage(role="assistant", content=part["text"])
+                        pending_text = part["text"]
                     break
+
+            # Each yield replaces the displayed reply, so only push the latest
+            # text at most once per flush interval.
+            now = loop.time()
+            if pending_text is not None and now - last_flush >= STREAM_FLUSH_INTERVAL:
+                yield gr.ChatMessage(role="assistant", content=pending_text)
+                pending_text = None
+                last_flush = now
+
+        if pending_text is not None:
+            yield gr.ChatMessage(role="assistant", content=pending_text)
     except Exception as e:
-        print(f"Error in get_response_from_agent (Type: {type(e)}): {e}")
-        traceback.print_exc()  # This will print the full traceback
+        logger.exception(
+            "Error in get_response_from_agent (Type: %s)", type(e).__name__
+        )
         yield gr.ChatMessage(
             role="assistant",
             content="An error occurred while processing your request. Please check the server logs for details.",
@@ -16,6 +16,8 @@ from typing import Any
 
 from common.langgraph_base_mcp_agent import LanggraphBaseMCPAgent
 
+SYSTEM_INSTRUCTION = """You are a specialized cocktail assistant. Your primary function is to utilize the provided tools to retrieve and relay cocktail information in response to user queries. You can handle all inquiries related to cocktails, drink recipes, ingredients, and mixology. You must rely exclusively on these tools for data and refrain from inventing information. Ensure that all responses include the detailed output from the tools used and are formatted in Markdown"""
+
 
 class CocktailAgent(LanggraphBaseMCPAgent):
     """CocktailAgent - a specialized assistant for Cocktail information."""
@@ -26,4 +28,4 @@ class CocktailAgent(LanggraphBaseMCPAgent):
 
     def get_system_instruction(self) -> str:
         """Return the system instruction for the Cocktail agent."""
-        return """You are a specialized cocktail assistant. Your primary function is to utilize the provided tools to retrieve and relay cocktail information in response to user queries. You can handle all inquiries related to cocktails, drink recipes, ingredients, and mixology. You must rely exclusively on these tools for data and refrain from inventing information. Ensure that all responses include the detailed output from the tools used and are formatted in Markdown"""
+        return SYSTEM_INSTRUCTION
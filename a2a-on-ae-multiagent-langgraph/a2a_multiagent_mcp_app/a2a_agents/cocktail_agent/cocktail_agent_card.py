@@ -12,9 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-# Helpers
-import logging
-
 # A2A
 from a2a.types import AgentSkill
 
@@ -22,8 +19,6 @@ from a2a.types import AgentSkill
 from vertexai.preview.reasoning_engines.templates.a2a import create_agent_card
 
 
-logging.getLogger().setLevel(logging.INFO)
-
 # Define a skill - a specific capability your agent offers
 # Agents can have multiple skills for different tasks
 cocktail_agent_skill = AgentSkill(
@@ -14,9 +14,12 @@
 # Author: Dave Wang
 """Base Agent for MCP-based A2A agents."""
 
+import functools
 import logging
 import os
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import AsyncIterable
 from typing import Any, Literal
 
@@ -29,11 +32,58 @@ from pydantic import BaseModel
 
 
 logger = logging.getLogger(__name__)
-if not logger.hasHandlers():
-    logging.basicConfig(level=logging.INFO)
 
 memory = MemorySaver()
 
+_TRUTHY = frozenset({"true", "1"})
+USE_VERTEXAI = (
+    os.getenv("GOOGLE_GENAI_USE_VERTEXAI", "TRUE").strip().lower() in _TRUTHY
+)
+
+# Conversation threads idle for longer than this are dropped from `memory`.
+THREAD_TTL_SECONDS = int(os.getenv("THREAD_TTL_SECONDS", "3600"))
+
+# thread_id -> last use (monotonic seconds), oldest first.
+_thread_last_used: OrderedDict[str, float] = OrderedDict()
+
+
+def _touch_thread(thread_id: str) -> None:
+    """Mark a thread as used and evict threads that have been idle too long.
+
+    Args:
+        thread_id: The conversation thread ID being used
+    """
+    now = time.monotonic()
+    _thread_last_used[thread_id] = now
+    _thread_last_used.move_to_end(thread_id)
+
+    while _thread_last_used:
+        oldest_id, last_used = next(iter(_thread_last_used.items()))
+        if now - last_used < THREAD_TTL_SECONDS:
+            break
+        del _thread_last_used[oldest_id]
+        memory.delete_thread(oldest_id)
+        logger.info("Evicted idle conversation thread %s", oldest_id)
+
+
+@functools.cache
+def _create_chat_model(model: str):
+    """Create the chat model once per model name and share it across agents.
+
+    Args:
+        model: The Gemini model name
+
+    Returns:
+        ChatVertexAI or ChatGoogleGenerativeAI instance
+    """
+    if USE_VERTEXAI:
+        # Using Vertex AI
+        logger.info("ChatVertexAI model initialized successfully.")
+        return ChatVertexAI(model=model)
+    # Using Google Generative AI
+    logger.info("ChatGoogleGenerativeAI model initialized successfully.")
+    return ChatGoogleGenerativeAI(model=model)
+
 
 class ResponseFormat(BaseModel):
     """Respond to the user in this format."""
@@ -97,18 +147,12 @@ class LanggraphBaseMCPAgent(ABC):
             if not model:
                 raise ValueError("GOOGLE_GENAI_MODEL environment variable is not set")
 
-            if os.getenv("GOOGLE_GENAI_USE_VERTEXAI", "TRUE").lower() in ["true", "1"]:
-                # Using Vertex AI
-                logger.info("ChatVertexAI model initialized successfully.")
-                return ChatVertexAI(model=model)
-            else:
-                # Using Google Generative AI
-                logger.info("ChatGoogleGenerativeAI model initialized successfully.")
-                return ChatGoogleGenerativeAI(model=model)
+            return _create_chat_model(model)
 
         except Exception as e:
             logger.error(
-                f"Failed to initialize model: {e}",
+                "Failed to initialize model: %s",
+                e,
                 exc_info=True,
             )
             raise
@@ -125,6 +169,7 @@ class LanggraphBaseMCPAgent(ABC):
         Yields:
             dict: Response dictionaries with status and content
         """
+        _touch_thread(context_id)
         inputs = {"messages": [("user", query)]}
         config = {"configurable": {"thread_id": context_id}}
 
@@ -135,18 +180,20 @@ class LanggraphBaseMCPAgent(ABC):
                 and message.tool_calls
                 and len(message.tool_calls) > 0
             ):
-                logger.info(f"Tool calls: {message.tool_calls}")
+                logger.info("Tool calls: %s", message.tool_calls)
                 yield {
                     "is_task_complete": False,
                     "require_user_input": False,
                     "content": self.get_tool_lookup_message(),
                 }
             elif isinstance(message, ToolMessage):
-                logger.info(f"Tool message content: {message.content}")
-                status = message.status if hasattr(message, "status") else "N/A"
-                logger.info(f"Tool message status: {status}")
-                if hasattr(message, "artifact") and message.artifact:
-                    logger.error(f"Tool error: {message.artifact}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Tool message content: %s", message.content)
+                    logger.info(
+                        "Tool message status: %s", getattr(message, "status", "N/A")
+                    )
+                if message.artifact:
+                    logger.error("Tool error: %s", message.artifact)
                 yield {
                     "is_task_complete": False,
                     "require_user_input": False,
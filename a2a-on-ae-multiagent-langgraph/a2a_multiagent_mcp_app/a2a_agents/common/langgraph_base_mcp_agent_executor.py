@@ -14,8 +14,10 @@
 # Author: Dave Wang
 """Base Agent Executor for MCP-based A2A agents."""
 
+import functools
 import logging
 import os
+import threading
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -38,14 +40,44 @@ from a2a.utils import (
 )
 from a2a.utils.errors import ServerError
 import google.auth
+from google.auth.credentials import Credentials
 from google.auth.transport.requests import Request as AuthRequest
 from google.oauth2.id_token import fetch_id_token
 from langchain_mcp_adapters.client import MultiServerMCPClient
 
 
 logger = logging.getLogger(__name__)
-if not logger.hasHandlers():
-    logging.basicConfig(level=logging.INFO)
+
+_refresh_lock = threading.Lock()
+# Shared transport so token refreshes reuse an open connection
+_auth_request = AuthRequest()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_credentials() -> Credentials:
+    """Resolve Application Default Credentials once per process."""
+    credentials, _ = google.auth.default()
+    return credentials
+
+
+def get_access_token() -> str:
+    """Return a current access token, refreshing only when it is about to expire.
+
+    The credentials are shared process-wide, so every MCP client reuses one
+    token until google-auth reports it expired instead of minting a new one
+    per client.
+
+    Returns:
+        str: The bearer token.
+    """
+    credentials = _default_credentials()
+    if not credentials.valid:
+        with _refresh_lock:
+            # Another client may have refreshed while we waited
+            if not credentials.valid:
+                logger.info("Refreshing Google Cloud credentials")
+                credentials.refresh(_auth_request)
+    return credentials.token
 
 
 class LanggraphBaseMCPAgentExecutor(AgentExecutor, ABC):
@@ -139,15 +171,8 @@ class LanggraphBaseMCPAgentExecutor(AgentExecutor, ABC):
             auth=None,  # noqa: ARG001
         ):
             """Factory that creates httpx.AsyncClient with Google Auth."""
-            # Explicitly get the default credentials
-            credentials, project_id = google.auth.default()
-
-            auth_request = AuthRequest()
-            # Refresh the credentials if they've expired
-            credentials.refresh(auth_request)
-
-            # Use the token from the credentials object
-            id_token = credentials.token
+            # Reuse the cached token; it is refreshed only near expiry
+            id_token = get_access_token()
 
             # Merge custom headers with auth headers
             client_headers = {
@@ -183,13 +208,13 @@ class LanggraphBaseMCPAgentExecutor(AgentExecutor, ABC):
             )
 
             mcp_tools = await self.mcp_client.get_tools()
-            logger.info(f"Retrieved {len(mcp_tools)} MCP tools")
+            logger.info("Retrieved %s MCP tools", len(mcp_tools))
 
             tool_count = len(mcp_tools) if mcp_tools else "no"
-            logger.info(f"Initializing AgentExecutor with {tool_count} MCP tools.")
+            logger.info("Initializing AgentExecutor with %s MCP tools.", tool_count)
 
             self.agent = self.create_agent(mcp_tools)
-            logger.info(f"{self.__class__.__name__} initialized successfully.")
+            logger.info("%s initialized successfully.", self.__class__.__name__)
 
     async def execute(
         self,
@@ -249,7 +274,7 @@ class LanggraphBaseMCPAgentExecutor(AgentExecutor, ABC):
                     break
 
         except Exception as e:
-            logger.error(f"An error occurred while streaming the response: {e}")
+            logger.error("An error occurred while streaming the response: %s", e)
             raise ServerError(error=InternalError()) from e
 
     def _validate_request(self, context: RequestContext) -> bool:  # noqa: ARG002
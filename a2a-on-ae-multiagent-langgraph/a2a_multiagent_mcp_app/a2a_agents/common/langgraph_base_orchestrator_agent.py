@@ -43,6 +43,10 @@ from a2a.types import (
 logger = logging.getLogger(__name__)
 memory = MemorySaver()
 
+# Upper bound on remote sends in flight at once. ToolNode runs the tool calls
+# of one model turn concurrently, so a wide fan-out is capped here.
+MAX_CONCURRENT_SENDS = 8
+
 
 class LanggraphBaseOrchestratorAgent(ABC):
     """Base class for LangGraph orchestrator agents.
@@ -87,6 +91,7 @@ class LanggraphBaseOrchestratorAgent(ABC):
         self.agents: str = ""
         self.remote_agent_addresses = remote_agent_addresses
         self._cards_loaded = False
+        self._send_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
 
     async def init_remote_agent_addresses(self, remote_agent_addresses: list[str]):
         """Initialize connections to remote agents by fetching their cards.
@@ -95,15 +100,26 @@ class LanggraphBaseOrchestratorAgent(ABC):
             remote_agent_addresses: List of remote agent URLs
         """
         logger.info(
-            f"Fetching agent cards from {len(remote_agent_addresses)} addresses..."
+            "Fetching agent cards from %s addresses...", len(remote_agent_addresses)
+        )
+        # Fetch all cards concurrently; one unreachable agent should not
+        # cancel the others.
+        results = await asyncio.gather(
+            *(self.retrieve_card(address) for address in remote_agent_addresses),
+            return_exceptions=True,
         )
-        async with asyncio.TaskGroup() as task_group:
-            for address in remote_agent_addresses:
-                task_group.create_task(self.retrieve_card(address))
+        for address, result in zip(remote_agent_addresses, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Failed to retrieve agent card from %s: %s",
+                    address,
+                    result,
+                    exc_info=result,
+                )
 
         self._cards_loaded = True
         logger.info(
-            f"All agent cards loaded! Agents available: {list(self.cards.keys())}"
+            "All agent cards loaded! Agents available: %s", list(self.cards.keys())
         )
 
     async def retrieve_card(self, address: str):
@@ -116,7 +132,7 @@ class LanggraphBaseOrchestratorAgent(ABC):
             self.httpx_client, base_url=address, agent_card_path="/v1/card"
         )
         card = await card_resolver.get_agent_card()
-        logger.info(f"Retrieved card for {card.name} from {address}")
+        logger.info("Retrieved card for %s from %s", card.name, address)
         self.register_agent_card(card)
 
     def register_agent_card(self, card: AgentCard):
@@ -280,7 +296,9 @@ class LanggraphBaseOrchestratorAgent(ABC):
         """
         if self.debug_mode:
             logger.debug(
-                f"send_message called - Agent: {agent_name}, Message: {message[:50]}..."
+                "send_message called - Agent: %s, Message: %s...",
+                agent_name,
+                message[:50],
             )
 
         if agent_name not in self.remote_agent_connections:
@@ -307,14 +325,17 @@ class LanggraphBaseOrchestratorAgent(ABC):
             context_id=context_id,
             task_id=task_id,
         )
-        response = await client.send_message(request_message)
+        async with self._send_semaphore:
+            response = await client.send_message(request_message)
 
         if isinstance(response, Message):
             parts_text = self._convert_parts_simple(response.parts)
             result = "\n".join(parts_text) if parts_text else "No response"
 
             if self.debug_mode:
-                logger.debug(f"Message response from {agent_name}: {result[:100]}...")
+                logger.debug(
+                    "Message response from %s: %s...", agent_name, result[:100]
+                )
 
             return result
 
@@ -353,7 +374,10 @@ class LanggraphBaseOrchestratorAgent(ABC):
 
         if self.debug_mode:
             logger.debug(
-                f"Task response from {agent_name} (State: {task.status.state}): {result[:100]}..."
+                "Task response from %s (State: %s): %s...",
+                agent_name,
+                task.status.state,
+                result[:100],
             )
 
         return result
@@ -14,8 +14,10 @@
 
 """Base Orchestrator Agent Executor for LangGraph-based A2A agents."""
 
+import datetime
 import logging
 import os
+import time
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
@@ -43,8 +45,9 @@ if TYPE_CHECKING:
 
 
 logger = logging.getLogger(__name__)
-if not logger.hasHandlers():
-    logging.basicConfig(level=logging.INFO)
+
+# Rebuild the cached auth header this long before the token actually expires
+_HEADER_EXPIRY_SKEW_SECONDS = 60
 
 
 class GoogleAuth(httpx.Auth):
@@ -55,17 +58,63 @@ class GoogleAuth(httpx.Auth):
             scopes=["https://www.googleapis.com/auth/cloud-platform"]
         )
         self.auth_request = AuthRequest()
+        self._header: str | None = None
+        self._header_deadline = 0.0
 
     def auth_flow(self, request):
-        """Authenticate the request with Google Cloud credentials."""
+        """Authenticate the request with Google Cloud credentials.
+
+        The header is reused until shortly before the token expires, so most
+        requests skip the credential check.
+        """
+        if self._header is not None and time.monotonic() < self._header_deadline:
+            request.headers["Authorization"] = self._header
+            yield request
+            return
+
         if not self.credentials.valid:
             logger.info("Refreshing expired Google Cloud credentials")
             self.credentials.refresh(self.auth_request)
 
-        request.headers["Authorization"] = f"Bearer {self.credentials.token}"
+        self._header = f"Bearer {self.credentials.token}"
+        self._header_deadline = 0.0
+        if self.credentials.expiry is not None:
+            now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+            remaining = (self.credentials.expiry - now).total_seconds()
+            self._header_deadline = (
+                time.monotonic() + remaining - _HEADER_EXPIRY_SKEW_SECONDS
+            )
+        request.headers["Authorization"] = self._header
         yield request
 
 
+# Connection pool bounds for the shared client
+SHARED_CLIENT_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+_shared_client: httpx.AsyncClient | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the process-wide authenticated httpx client, creating it on first use.
+
+    Every orchestrator and its RemoteAgentConnections send through this one
+    client, so calls to the remote A2A agents reuse pooled keep-alive
+    connections instead of paying a fresh TLS handshake per executor.
+
+    Returns:
+        An httpx.AsyncClient with Google Cloud auth and a bounded pool.
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=120,
+            limits=SHARED_CLIENT_LIMITS,
+            auth=GoogleAuth(),
+            headers={"Content-Type": "application/json"},
+        )
+    return _shared_client
+
+
 class LanggraphBaseOrchestratorAgentExecutor(AgentExecutor, ABC):
     """Base class for LangGraph orchestrator agent executors.
 
@@ -121,16 +170,11 @@ class LanggraphBaseOrchestratorAgentExecutor(AgentExecutor, ABC):
     async def _init_agent(self) -> None:
         """Lazy initialization of agent resources.
 
-        Creates an HTTP client with Google Cloud authentication and
+        Uses the shared HTTP client with Google Cloud authentication and
         initializes the LangGraph agent with all remote agent cards loaded.
         """
         if self.agent is None:
-            httpx_client = httpx.AsyncClient(
-                timeout=120,
-                auth=GoogleAuth(),
-            )
-            httpx_client.headers["Content-Type"] = "application/json"
-            self.agent = await self.create_orchestrator_agent(httpx_client)
+            self.agent = await self.create_orchestrator_agent(get_shared_client())
 
     async def execute(
         self,
@@ -149,7 +193,7 @@ class LanggraphBaseOrchestratorAgentExecutor(AgentExecutor, ABC):
 
         # Extract the user's question from the protocol message
         query = context.get_user_input()
-        logger.info(f"Received query: {query}")
+        logger.info("Received query: %s", query)
 
         task = context.current_task
         if not task:
@@ -188,7 +232,7 @@ class LanggraphBaseOrchestratorAgentExecutor(AgentExecutor, ABC):
                     iteration_count += 1
 
                     if self.debug_mode:
-                        logger.debug(f"Iteration {iteration_count}")
+                        logger.debug("Iteration %s", iteration_count)
 
                     # Each chunk contains the full state with messages
                     if "messages" in chunk:
@@ -209,7 +253,8 @@ class LanggraphBaseOrchestratorAgentExecutor(AgentExecutor, ABC):
                                     final_response = str(last_message.content)
                                     if self.debug_mode:
                                         logger.debug(
-                                            f"AI final response: {final_response[:100]}"
+                                            "AI final response: %s",
+                                            final_response[:100],
                                         )
 
                             # Check if it's an AI message
@@ -250,7 +295,9 @@ class LanggraphBaseOrchestratorAgentExecutor(AgentExecutor, ABC):
             except GraphRecursionError as e:
                 # Handle recursion limit gracefully
                 logger.warning(
-                    f"Recursion limit reached after {iteration_count} iterations: {e}"
+                    "Recursion limit reached after %s iterations: %s",
+                    iteration_count,
+                    e,
                 )
                 final_response = self.get_recursion_error_message()
                 needs_input = False
@@ -283,7 +330,7 @@ class LanggraphBaseOrchestratorAgentExecutor(AgentExecutor, ABC):
                 raise ValueError("No response received from agent")
 
         except Exception as e:
-            logger.error(f"An error occurred while streaming the response: {e}")
+            logger.error("An error occurred while streaming the response: %s", e)
             raise ServerError(error=InternalError()) from e
 
     def get_recursion_error_message(self) -> str:
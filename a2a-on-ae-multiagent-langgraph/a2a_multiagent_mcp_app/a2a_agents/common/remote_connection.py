@@ -14,9 +14,9 @@
 # Author: Dave Wang
 """Remote connections helper."""
 
-import traceback
+import logging
 
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 
 from a2a.client import (
     Client,
@@ -32,43 +32,71 @@ from a2a.types import (
 )
 
 
+logger = logging.getLogger(__name__)
+
 TaskCallbackArg = Task | TaskStatusUpdateEvent | TaskArtifactUpdateEvent
 TaskUpdateCallback = Callable[[TaskCallbackArg, AgentCard], Task]
 
+# Task states after which the remote agent's stream has nothing more to add
+_TERMINAL_OR_INTERRUPTED_STATES = frozenset(
+    {
+        TaskState.completed,
+        TaskState.canceled,
+        TaskState.failed,
+        TaskState.input_required,
+        TaskState.unknown,
+    }
+)
+
 
 class RemoteAgentConnections:
     """A class to hold the connections to the remote agents."""
 
+    __slots__ = ("agent_client", "card", "name")
+
     def __init__(self, client_factory: ClientFactory, agent_card: AgentCard):
         self.agent_client: Client = client_factory.create(agent_card)
         self.card: AgentCard = agent_card
-        self.pending_tasks = set()
+        self.name: str = agent_card.name
 
     def get_agent(self) -> AgentCard:
         return self.card
 
-    async def send_message(self, message: Message) -> Task | Message | None:
-        lastTask: Task | None = None
+    async def stream_message(self, message: Message) -> AsyncIterator[Task | Message]:
+        """Sends a message and yields the remote agent's updates as they arrive.
+
+        The stream ends after a Message or a terminal or interrupted task, so
+        callers can surface progress without waiting for the final result.
+
+        Args:
+            message: The message to send.
+
+        Yields:
+            Each task update, or the single Message the agent replied with.
+        """
         try:
-            print("Sending message to remote agent:", message)
+            logger.info("Sending message to remote agent: %s", self.name)
+            logger.debug("Message content: %s", message)
             async for event in self.agent_client.send_message(message):
                 if isinstance(event, Message):
-                    print("got event object from remote agent:", event)
-                    return event
-                if self.is_terminal_or_interrupted(event[0]):
-                    return event[0]
-                lastTask = event[0]
-        except Exception as e:
-            print("Exception found in send_message")
-            traceback.print_exc()
-            raise e
-        return lastTask
-
-    def is_terminal_or_interrupted(self, task: Task) -> bool:
-        return task.status.state in [
-            TaskState.completed,
-            TaskState.canceled,
-            TaskState.failed,
-            TaskState.input_required,
-            TaskState.unknown,
-        ]
+                    logger.info("Received message object from remote agent")
+                    logger.debug("Message content: %s", event)
+                    yield event
+                    return
+                task = event[0]
+                yield task
+                if self.is_terminal_or_interrupted(task):
+                    return
+        except Exception:
+            logger.exception("Exception in send_message to %s", self.name)
+            raise
+
+    async def send_message(self, message: Message) -> Task | Message | None:
+        last: Task | Message | None = None
+        async for event in self.stream_message(message):
+            last = event
+        return last
+
+    @staticmethod
+    def is_terminal_or_interrupted(task: Task) -> bool:
+        return task.status.state in _TERMINAL_OR_INTERRUPTED_STATES
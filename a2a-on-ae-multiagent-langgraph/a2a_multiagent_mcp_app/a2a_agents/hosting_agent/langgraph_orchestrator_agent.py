@@ -12,16 +12,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import os
 
 import httpx
-from dotenv import load_dotenv
 
 from common.langgraph_base_orchestrator_agent import (
     LanggraphBaseOrchestratorAgent,
 )
 
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Static prompt body; only the agent list and active agent vary per call.
+SYSTEM_PROMPT_TEMPLATE = """You are a helpful assistant that can answer questions about weather and cocktails by delegating to specialized agents.
+
+CRITICAL RULES:
+1. For greetings or small talk (hi, hello, how are you, what's up), respond directly WITHOUT using any tools.
+2. For questions about your capabilities (what can you do, help), describe both weather and cocktail capabilities WITHOUT using tools.
+3. ONLY use tools for actual weather or cocktail questions.
+4. When you use a tool, call it ONCE per agent and then return the response. If a question needs both agents, call send_message for each of them in the same turn so they run in parallel.
+5. NEVER call the same tool multiple times in a row.
+
+Available Agents:
+{agents_list}
+
+Current active agent: {current_agent}
+
+Example interactions:
+User: "hi" → You: "Hello! I can help with weather forecasts and cocktail recipes. What would you like to know?"
+User: "how are you" → You: "I'm doing well, thank you! I can assist with weather information and cocktail recipes."
+User: "weather in LA" → You: Use send_message tool with Weather Agent ONCE, then return the result
+User: "margarita recipe" → You: Use send_message tool with Cocktail Agent ONCE, then return the result
+User: "weather in LA and a margarita recipe" → You: Use send_message with Weather Agent and Cocktail Agent in the same turn, then return both results
+"""
 
 
 class HostingAgent(LanggraphBaseOrchestratorAgent):
@@ -53,34 +76,15 @@ class HostingAgent(LanggraphBaseOrchestratorAgent):
         current_agent = self.check_state(state).get("active_agent", "None")
 
         if self.debug_mode:
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.debug(
-                f"Prompt function - Agents: {len(self.cards)}, "
-                f"Messages: {len(state.get('messages', []))}"
+                "Prompt function - Agents: %d, Messages: %d",
+                len(self.cards),
+                len(state.get("messages", ())),
             )
 
-        return f"""You are a helpful assistant that can answer questions about weather and cocktails by delegating to specialized agents.
-
-CRITICAL RULES:
-1. For greetings or small talk (hi, hello, how are you, what's up), respond directly WITHOUT using any tools.
-2. For questions about your capabilities (what can you do, help), describe both weather and cocktail capabilities WITHOUT using tools.
-3. ONLY use tools for actual weather or cocktail questions.
-4. When you use a tool, use it ONLY ONCE and then return the response.
-5. NEVER call the same tool multiple times in a row.
-
-Available Agents:
-{agents_list}
-
-Current active agent: {current_agent}
-
-Example interactions:
-User: "hi" → You: "Hello! I can help with weather forecasts and cocktail recipes. What would you like to know?"
-User: "how are you" → You: "I'm doing well, thank you! I can assist with weather information and cocktail recipes."
-User: "weather in LA" → You: Use send_message tool with Weather Agent ONCE, then return the result
-User: "margarita recipe" → You: Use send_message tool with Cocktail Agent ONCE, then return the result
-"""
+        return SYSTEM_PROMPT_TEMPLATE.format(
+            agents_list=agents_list, current_agent=current_agent
+        )
 
 
 async def get_root_agent(httpx_client: httpx.AsyncClient | None = None):
@@ -15,7 +15,6 @@
 from typing import TYPE_CHECKING
 
 import httpx
-from dotenv import load_dotenv
 
 if TYPE_CHECKING:
     from langgraph.graph.graph import CompiledGraph
@@ -25,8 +24,6 @@ from common.langgraph_base_orchestrator_agent_executor import (
 )
 from hosting_agent.langgraph_orchestrator_agent import get_root_agent
 
-load_dotenv()
-
 
 class HostingAgentExecutor(LanggraphBaseOrchestratorAgentExecutor):
     """Agent Executor that bridges A2A protocol with LangGraph agent."""
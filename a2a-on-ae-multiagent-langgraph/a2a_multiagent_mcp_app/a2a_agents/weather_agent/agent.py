@@ -16,6 +16,14 @@ from typing import Any
 
 from common.langgraph_base_mcp_agent import LanggraphBaseMCPAgent
 
+SYSTEM_INSTRUCTION = (
+    "You are a specialized weather forecast assistant. Your primary function is "
+    "to utilize the provided tools to retrieve and relay weather information in "
+    "response to user queries. You must rely exclusively on these tools for data "
+    "and refrain from inventing information. Ensure that all responses include "
+    "the detailed output from the tools used and are formatted in Markdown"
+)
+
 
 class WeatherAgent(LanggraphBaseMCPAgent):
     """WeatherAgent - a specialized assistant for weather forecasts."""
@@ -26,10 +34,4 @@ class WeatherAgent(LanggraphBaseMCPAgent):
 
     def get_system_instruction(self) -> str:
         """Return the system instruction for the Weather agent."""
-        return (
-            "You are a specialized weather forecast assistant. Your primary function is "
-            "to utilize the provided tools to retrieve and relay weather information in "
-            "response to user queries. You must rely exclusively on these tools for data "
-            "and refrain from inventing information. Ensure that all responses include "
-            "the detailed output from the tools used and are formatted in Markdown"
-        )
+        return SYSTEM_INSTRUCTION
@@ -26,14 +26,15 @@ The main components are:
 """
 
 import asyncio
+import logging
 import os
-import traceback
+from contextlib import aclosing
 from typing import AsyncIterator, List
 
 import gradio as gr
 import httpx
 import vertexai
-from a2a.client import Client, ClientConfig, ClientFactory
+from a2a.client import A2AClientHTTPError, Client, ClientConfig, ClientFactory
 from a2a.types import (
     Message,
     Part,
@@ -47,6 +48,12 @@ from google.auth import default
 from google.auth.transport.requests import Request as AuthRequest
 from google.genai import types as genai_types  # Aliased to avoid conflict
 
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
 load_dotenv()
 
 PROJECT_ID = os.getenv("PROJECT_ID")
@@ -69,8 +76,18 @@ client = vertexai.Client(
 
 remote_a2a_agent_resource_name = f"projects/{PROJECT_NUMBER}/locations/us-central1/reasoningEngines/{AGENT_ENGINE_ID}"
 
+AGENT_CARD_CONFIG = {
+    "http_options": {"base_url": f"https://{LOCATION}-aiplatform.googleapis.com"}
+}
 
-load_dotenv()
+# Longest error text echoed back into the chat history.
+MAX_ERROR_MESSAGE_LENGTH = 512
+
+# A2A client shared by all chat turns, created on first use, and the
+# authenticated httpx client it sends through.
+_a2a_client: Client | None = None
+_httpx_client: httpx.AsyncClient | None = None
+_a2a_client_lock = asyncio.Lock()
 
 
 class GoogleAuth(httpx.Auth):
@@ -99,7 +116,7 @@ class GoogleAuth(httpx.Auth):
         """
         # Refresh the credentials if they are expired
         if not self.credentials.valid:
-            print("Credentials expired, refreshing...")
+            logger.info("Credentials expired, refreshing...")
             self.credentials.refresh(self.auth_request)
 
         # Add the Authorization header to the request
@@ -109,49 +126,75 @@ class GoogleAuth(httpx.Auth):
 
 async def get_agent_card(resource_name: str):
     """Fetches the agent card from Vertex AI."""
-    config = {
-        "http_options": {"base_url": f"https://{LOCATION}-aiplatform.googleapis.com"}
-    }
-
     remote_a2a_agent = client.agent_engines.get(
         name=resource_name,
-        config=config,
+        config=AGENT_CARD_CONFIG,
     )
 
     return await remote_a2a_agent.handle_authenticated_agent_card()
 
 
+async def get_a2a_client() -> Client:
+    """Returns the shared A2A client, creating it on first use.
+
+    The agent card and authenticated httpx client are stable for the lifetime
+    of the process, so a single client is reused across chat turns.
+    """
+    global _a2a_client, _httpx_client
+
+    async with _a2a_client_lock:
+        if _a2a_client is None:
+            # --- 1. Get Agent Card ---
+            logger.info("Fetching agent card...")
+            remote_a2a_agent_card = await get_agent_card(
+                remote_a2a_agent_resource_name
+            )
+            logger.info("Agent card fetched.")
+
+            # --- 2. Create HTTP Client with Auth ---
+            _httpx_client = httpx.AsyncClient(
+                timeout=120,
+                auth=GoogleAuth(),
+            )
+
+            # --- 3. Create A2A Client ---
+            factory = ClientFactory(
+                ClientConfig(
+                    supported_transports=[TransportProtocol.http_json],
+                    use_client_preference=True,
+                    httpx_client=_httpx_client,  # Pass the authenticated client
+                )
+            )
+            _a2a_client = factory.create(remote_a2a_agent_card)
+            logger.info("A2A client created.")
+
+    return _a2a_client
+
+
+async def close_a2a_client() -> None:
+    """Closes the shared A2A client so the next chat turn builds a new one."""
+    global _a2a_client, _httpx_client
+
+    async with _a2a_client_lock:
+        a2a_client, httpx_client = _a2a_client, _httpx_client
+        _a2a_client = _httpx_client = None
+        # Close the A2A client, then the httpx client it was given
+        if a2a_client:
+            await a2a_client.close()
+            logger.info("A2A client closed.")
+        if httpx_client:
+            await httpx_client.aclose()
+            logger.info("HTTPX client closed.")
+
+
 async def get_response_from_agent(
     query: str,
     history: List[gr.ChatMessage],
 ) -> AsyncIterator[gr.ChatMessage]:
     """Get response from host agent."""
 
-    a2a_client: Client = None  # Define client for the finally block
-    httpx_client: httpx.AsyncClient = None  # Define httpx_client for the finally block
-
     try:
-        # --- 1. Get Agent Card ---
-        print("Fetching agent card...")
-        remote_a2a_agent_card = await get_agent_card(remote_a2a_agent_resource_name)
-        print("Agent card fetched.")
-
-        # --- 2. Create HTTP Client with Auth ---
-        httpx_client = httpx.AsyncClient(
-            timeout=120,
-            auth=GoogleAuth(),
-        )
-
-        # --- 3. Create A2A Client ---
-        factory = ClientFactory(
-            ClientConfig(
-                supported_transports=[TransportProtocol.http_json],
-                use_client_preference=True,
-                httpx_client=httpx_client,  # Pass the authenticated client
-            )
-        )
-        a2a_client = factory.create(remote_a2a_agent_card)
-        print("A2A client created.")
+        a2a_client = await get_a2a_client()
 
         # --- 4. Create Message ---
         message = Message(
@@ -161,69 +204,70 @@ async def get_response_from_agent(
         )
 
         # --- 5. Send Message and Stream Response ---
-        print(f"Sending message to agent: {query}")
-        response_stream = a2a_client.send_message(message)
+        logger.info("Sending message to agent: %s", query)
 
         final_result_text = None
 
-        # Iterate over the async generator which yields task status updates
-        async for response_chunk in response_stream:
-            task_object = response_chunk[0]  # Task object is the first element
-
-            print(f"Received task update. Status: {task_object.status.state}")
-
-            # Wait for the task to complete
-            if task_object.status.state == TaskState.completed:
-                print("Task completed. Checking for artifacts...")
-                if hasattr(task_object, "artifacts") and task_object.artifacts:
-                    for artifact in task_object.artifacts:
-                        # Find the first text part in the artifacts
-                        if artifact.parts and isinstance(
-                            artifact.parts[0].root, TextPart
-                        ):
-                            final_result_text = artifact.parts[0].root.text
-                            print(f"Found artifact text: {final_result_text[:50]}...")
-                            break  # Stop looking at artifacts
-                if final_result_text:
-                    break  # Stop iterating task updates
-
-            # Handle task failure
-            elif task_object.status.state == TaskState.failed:
-                error_message = f"Task failed: {task_object.status.message if task_object.status else 'Unknown error'}"
-                print(error_message)
-                yield gr.ChatMessage(role="assistant", content=error_message)
-                return  # Exit the generator
+        # Close the stream as soon as we stop reading so the connection is
+        # released even when we break out early.
+        async with aclosing(a2a_client.send_message(message)) as response_stream:
+            # Iterate over the async generator which yields task status updates
+            async for response_chunk in response_stream:
+                task_object = response_chunk[0]  # Task object is the first element
+
+                logger.info(
+                    "Received task update. Status: %s", task_object.status.state
+                )
+
+                # Wait for the task to complete
+                if task_object.status.state == TaskState.completed:
+                    logger.info("Task completed. Checking for artifacts...")
+                    if hasattr(task_object, "artifacts") and task_object.artifacts:
+                        for artifact in task_object.artifacts:
+                            # Find the first text part in the artifacts
+                            if artifact.parts and isinstance(
+                                artifact.parts[0].root, TextPart
+                            ):
+                                final_result_text = artifact.parts[0].root.text
+                                logger.info(
+                                    "Found artifact text: %s...",
+                                    final_result_text[:50],
+                                )
+                                break  # Stop looking at artifacts
+                    if final_result_text:
+                        break  # Stop iterating task updates
+
+                # Handle task failure
+                elif task_object.status.state == TaskState.failed:
+                    error_message = f"Task failed: {task_object.status.message if task_object.status else 'Unknown error'}"
+                    logger.info(error_message)
+                    yield gr.ChatMessage(role="assistant", content=error_message)
+                    return  # Exit the generator
 
         # --- 6. Yield Final Response ---
         if final_result_text:
             yield gr.ChatMessage(role="assistant", content=final_result_text)
         else:
-            print("Task finished but no text artifact was found.")
+            logger.info("Task finished but no text artifact was found.")
             yield gr.ChatMessage(
                 role="assistant",
                 content="I processed your request but found no text response.",
             )
 
     except Exception as e:
-        print(f"Error in get_response_from_agent (Type: {type(e)}): {e}")
-        traceback.print_exc()  # This will print the full traceback
+        logger.exception(
+            "Error in get_response_from_agent (Type: %s)", type(e).__name__
+        )
+        if isinstance(e, (httpx.TransportError, A2AClientHTTPError)):
+            # The cached client may be broken; rebuild it on the next turn
+            await close_a2a_client()
         yield gr.ChatMessage(
             role="assistant",
-            content=f"An error occurred: {e}",
+            content=f"An error occurred: {e}"[:MAX_ERROR_MESSAGE_LENGTH],
         )
-    finally:
-        # --- 7. Clean up clients ---
-        # Close the A2A client, which also closes the httpx_client it manages
-        if a2a_client:
-            await a2a_client.close()
-            print("A2A client closed.")
-        elif httpx_client:
-            # Fallback if a2a_client creation failed but httpx_client was made
-            await httpx_client.aclose()
-            print("HTTPX client closed.")
 
 
-async def main():
+def main():
     """Main gradio app."""
 
     with gr.Blocks(theme=gr.themes.Ocean(), title="A2A Host Agent") as demo:
@@ -248,6 +292,8 @@ async def main():
         )
 
     print("Launching Gradio interface on http://0.0.0.0:8080")
+    # The shared A2A client lives on Gradio's event loop, so it is left for
+    # process exit rather than closed here.
     demo.queue().launch(
         server_name="0.0.0.0",
         server_port=8080,
@@ -261,4 +307,4 @@ if __name__ == "__main__":
         os.makedirs("static")
         print("Created 'static' directory. Please add your 'a2a.png' image there.")
 
-    asyncio.run(main())
+    main()
@@ -13,22 +13,104 @@
 # limitations under the License.
 # Author: Dave Wang
 
-import logging
-from typing import Dict
-from dotenv import load_dotenv
+from typing import Mapping
 
 from common.agent_configs import COCKTAIL_AGENT_CONFIG
-from common.adk_base_mcp_agent_executor import AdkBaseMcpAgentExecutor
+from common.adk_base_mcp_agent_executor import (
+    AdkBaseMcpAgentExecutor,
+    get_or_create_memory_bank_engine,
+)
 
-# Set logging
-logging.getLogger().setLevel(logging.INFO)
-load_dotenv()
+
+COCKTAIL_MEMORY_EXAMPLE = {
+    "conversationSource": {
+        "events": [
+            {
+                "content": {
+                    "role": "model",
+                    "parts": [
+                        {
+                            "text": (
+                                "Here is the recipe for the Margarita cocktail:\n\n"
+                                "Margarita\n"
+                                "ID: 11007\n"
+                                "Category: Ordinary Drink\n"
+                                "Glass: Cocktail glass\n"
+                                "Alcoholic: Alcoholic\n"
+                                "Instructions: Rub the rim of the glass with the lime "
+                                "slice to make the salt stick to it. Take care to "
+                                "moisten only the outer rim and sprinkle the salt on "
+                                "it. The salt should be applied to the outside edge of "
+                                "the glass. Shake the tequila, Cointreau, and lime "
+                                "juice with ice, then strain into the prepared glass."
+                            )
+                        }
+                    ],
+                }
+            },
+            {
+                "content": {
+                    "role": "user",
+                    "parts": [{"text": "What are the recipes for a Margarita?"}],
+                }
+            },
+        ]
+    },
+    "generatedMemories": [
+        {
+            "fact": (
+                "Margarita\n"
+                "ID: 11007\n"
+                "Category: Ordinary Drink\n"
+                "Glass: Cocktail glass\n"
+                "Alcoholic: Alcoholic\n"
+                "Instructions: Rub the rim of the glass with the lime slice to "
+                "make the salt stick to it. Take care to moisten only the "
+                "outer rim and sprinkle the salt on it. The salt should be "
+                "applied to the outside edge of the glass. Shake the tequila, "
+                "Cointreau, and lime juice with ice, then strain into the "
+                "prepared glass.."
+            )
+        },
+        {"fact": "The user asked for ingredients for a Margarita."},
+    ],
+}
+
+COCKTAIL_MEMORY_CONFIG = {
+    "generate_memories_examples": [COCKTAIL_MEMORY_EXAMPLE],
+    "memory_topics": [
+        {
+            "custom_memory_topic": {
+                "label": "cocktail_id",
+                "description": "cocktail id retrieved from MCP server",
+            }
+        },
+        {
+            "custom_memory_topic": {
+                "label": "cocktail_recipe",
+                "description": "cocktail recipe from MCP server",
+            }
+        },
+        {
+            "custom_memory_topic": {
+                "label": "cocktail_ingredients",
+                "description": "cocktail ingredients from MCP server",
+            }
+        },
+        {"managed_memory_topic": {"managed_topic_enum": "USER_PERSONAL_INFO"}},
+        {"managed_memory_topic": {"managed_topic_enum": "USER_PREFERENCES"}},
+        {"managed_memory_topic": {"managed_topic_enum": "KEY_CONVERSATION_DETAILS"}},
+        {"managed_memory_topic": {"managed_topic_enum": "EXPLICIT_INSTRUCTIONS"}},
+    ],
+}
 
 
 class CocktailAgentExecutor(AdkBaseMcpAgentExecutor):
     """Agent Executor for cocktail-related queries using MCP tools."""
 
-    def get_agent_config(self) -> Dict:
+    memory_bank_engine_env = "COCKTAIL_MEMORY_ENGINE_ID"
+
+    def get_agent_config(self) -> Mapping[str, str]:
         """Return cocktail agent configuration."""
         return COCKTAIL_AGENT_CONFIG
 
@@ -46,119 +128,6 @@ class CocktailAgentExecutor(AdkBaseMcpAgentExecutor):
         Returns:
             str: Agent engine ID
         """
-        import vertexai
-
-        client = vertexai.Client(
-            project=self.project_id,
-            location=self.location,
-        )
-
-        example = {
-            "conversationSource": {
-                "events": [
-                    {
-                        "content": {
-                            "role": "model",
-                            "parts": [
-                                {
-                                    "text": (
-                                        "Here is the recipe for the Margarita cocktail:\n\n"
-                                        "Margarita\n"
-                                        "ID: 11007\n"
-                                        "Category: Ordinary Drink\n"
-                                        "Glass: Cocktail glass\n"
-                                        "Alcoholic: Alcoholic\n"
-                                        "Instructions: Rub the rim of the glass with the lime "
-                                        "slice to make the salt stick to it. Take care to "
-                                        "moisten only the outer rim and sprinkle the salt on "
-                                        "it. The salt should be applied to the outside edge of "
-                                        "the glass. Shake the tequila, Cointreau, and lime "
-                                        "juice with ice, then strain into the prepared glass."
-                                    )
-                                }
-                            ],
-                        }
-                    },
-                    {
-                        "content": {
-                            "role": "user",
-                            "parts": [
-                                {"text": "What are the recipes for a Margarita?"}
-                            ],
-                        }
-                    },
-                ]
-            },
-            "generatedMemories": [
-                {
-                    "fact": (
-                        "Margarita\n"
-                        "ID: 11007\n"
-                        "Category: Ordinary Drink\n"
-                        "Glass: Cocktail glass\n"
-                        "Alcoholic: Alcoholic\n"
-                        "Instructions: Rub the rim of the glass with the lime slice to "
-                        "make the salt stick to it. Take care to moisten only the "
-                        "outer rim and sprinkle the salt on it. The salt should be "
-                        "applied to the outside edge of the glass. Shake the tequila, "
-                        "Cointreau, and lime juice with ice, then strain into the "
-                        "prepared glass.."
-                    )
-                },
-                {"fact": "The user asked for ingredients for a Margarita."},
-            ],
-        }
-
-        user_preferences_config = {
-            "generate_memories_examples": [example],
-            "memory_topics": [
-                {
-                    "custom_memory_topic": {
-                        "label": "cocktail_id",
-                        "description": "cocktail id retrieved from MCP server",
-                    }
-                },
-                {
-                    "custom_memory_topic": {
-                        "label": "cocktail_recipe",
-                        "description": "cocktail recipe from MCP server",
-                    }
-                },
-                {
-                    "custom_memory_topic": {
-                        "label": "cocktail_ingredients",
-                        "description": "cocktail ingredients from MCP server",
-                    }
-                },
-                {"managed_memory_topic": {"managed_topic_enum": "USER_PERSONAL_INFO"}},
-                {"managed_memory_topic": {"managed_topic_enum": "USER_PREFERENCES"}},
-                {
-                    "managed_memory_topic": {
-                        "managed_topic_enum": "KEY_CONVERSATION_DETAILS"
-                    }
-                },
-                {
-                    "managed_memory_topic": {
-                        "managed_topic_enum": "EXPLICIT_INSTRUCTIONS"
-                    }
-                },
-            ],
-        }
-
-        agent_engine = client.agent_engines.create(
-            config={
-                "context_spec": {
-                    "memory_bank_config": {
-                        "generation_config": {
-                            "model": (
-                                f"projects/{self.project_id}/locations/{self.location}/"
-                                "publishers/google/models/gemini-2.5-flash"
-                            )
-                        },
-                        "customization_configs": [user_preferences_config],
-                    }
-                }
-            }
+        return get_or_create_memory_bank_engine(
+            self.project_id, self.location, [COCKTAIL_MEMORY_CONFIG]
         )
-        agent_engine_id = agent_engine.api_resource.name.split("/")[-1]
-        return agent_engine_id
@@ -13,3 +13,11 @@
 # limitations under the License.
 # Author: Dave Wang
 """Common utilities for A2A agents."""
+
+import logging
+
+from dotenv import load_dotenv
+
+# One-time process setup shared by every agent module; package import runs once
+logging.getLogger().setLevel(logging.INFO)
+load_dotenv()
@@ -12,12 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # Author: Dave Wang
+import asyncio
+import functools
+import json
 import logging
 import os
+import random
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, NoReturn
+from typing import Dict, List, Mapping, NoReturn, Optional
 
+import requests
+import vertexai
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.server.tasks import TaskUpdater
@@ -27,18 +34,42 @@ from a2a.utils.errors import ServerError
 from google import adk
 from google.adk import Runner
 from google.adk.agents import LlmAgent
-from google.adk.artifacts import InMemoryArtifactService
+from google.adk.agents.readonly_context import ReadonlyContext
 from google.adk.memory import VertexAiMemoryBankService
-from google.adk.sessions import VertexAiSessionService
+from google.adk.sessions import Session, VertexAiSessionService
+from google.adk.tools.base_tool import BaseTool
 from google.genai import Client
 from google.adk.tools.mcp_tool.mcp_toolset import (
     McpToolset,
     StreamableHTTPConnectionParams,
 )
 from google.auth import exceptions as google_auth_exceptions
+from google.auth import jwt as google_auth_jwt
 from google.auth.transport import requests as google_auth_requests
 from google.genai import types
 from google.oauth2 import id_token as google_id_token
+from requests.adapters import HTTPAdapter
+
+from common.artifact_service import BoundedArtifactService
+from common.session_cache import SessionCache
+
+logger = logging.getLogger(__name__)
+
+# Plain string rather than the enum: model_construct skips pydantic's coercion
+_USER_ROLE = Role.user.value
+
+
+def _create_auth_request() -> google_auth_requests.Request:
+    """Create a google-auth transport backed by a pooled, keep-alive session."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return google_auth_requests.Request(session=session)
+
+
+# Shared transport for OIDC token fetches so refreshes reuse open connections.
+_AUTH_REQUEST = _create_auth_request()
 
 
 def get_gcp_auth_headers(audience: str) -> Dict[str, str]:
@@ -54,22 +85,29 @@ def get_gcp_auth_headers(audience: str) -> Dict[str, str]:
         audience: The full URL/URI of the target service (e.g., your Cloud Run URL),
                   which is used as the audience for the OIDC token.
 
+    Set SKIP_GCP_AUTH=1 for local development against an unauthenticated
+    server; this returns immediately instead of probing for credentials,
+    which can wait on metadata server timeouts when there are none.
+
     Returns:
         A dictionary with the "Authorization" header, or an empty
         dictionary if auth fails or is skipped (e.g., no credentials).
     """
+    if os.getenv("SKIP_GCP_AUTH", "").lower() in ("1", "true"):
+        logger.info("SKIP_GCP_AUTH is set; skipping OIDC token fetch.")
+        return {}
+
     try:
         # This single call is the canonical way to get an OIDC token using ADC.
         # It automatically finds credentials (local, SA, or metadata server).
-        auth_req = google_auth_requests.Request()
-        token = google_id_token.fetch_id_token(auth_req, audience)
+        token = google_id_token.fetch_id_token(_AUTH_REQUEST, audience)
 
-        logging.info("Successfully fetched OIDC token via google.auth.")
+        logger.info("Successfully fetched OIDC token via google.auth.")
         return {"Authorization": f"Bearer {token}"}
 
     except google_auth_exceptions.DefaultCredentialsError:
         # This is expected in local environments without ADC setup.
-        logging.warning(
+        logger.warning(
             "No Google Cloud credentials found (DefaultCredentialsError). "
             "Skipping OIDC token fetch. This is normal for local dev."
         )
@@ -77,9 +115,10 @@ def get_gcp_auth_headers(audience: str) -> Dict[str, str]:
     except Exception as e:
         # Any other error means ADC was likely found but token minting failed
         # (e.g., IAM permissions, wrong audience, metadata server unreachable).
-        logging.critical(
-            f"An unexpected error occurred fetching OIDC token for audience "
-            f"'{audience}': {e}",
+        logger.critical(
+            "An unexpected error occurred fetching OIDC token for audience '%s': %s",
+            audience,
+            e,
             exc_info=True,
         )
 
@@ -105,21 +144,191 @@ class PersistentVertexAiMemoryBankService(VertexAiMemoryBankService):
         super().__init__(
             project=project, location=location, agent_engine_id=agent_engine_id
         )
-        # Create and cache both the Client and API client once
-        self._persistent_client = None
-        self._persistent_api_client = None
+        # Create and cache both the Client and API client once, up front, so
+        # memory operations never pay for the check
+        # Keep the Client object alive to prevent httpx client closure
+        self._persistent_client = _get_vertexai_client(project, location)
+        self._persistent_api_client = self._persistent_client._api_client
 
     def _get_api_client(self):
         """Override to return a persistent API client instead of creating new ones."""
-        if self._persistent_api_client is None:
-            # Keep the Client object alive to prevent httpx client closure
-            self._persistent_client = Client(
-                vertexai=True, project=self._project, location=self._location
-            )
-            self._persistent_api_client = self._persistent_client._api_client
         return self._persistent_api_client
 
 
+@functools.lru_cache(maxsize=32)
+def _get_vertexai_client(project: str, location: str) -> Client:
+    """Return a process-wide Vertex AI Client for the project and location."""
+    return Client(vertexai=True, project=project, location=location)
+
+
+@functools.lru_cache(maxsize=4)
+def get_agent_engine_client(project: str, location: str) -> vertexai.Client:
+    """Return a process-wide vertexai.Client for managing agent engines.
+
+    Args:
+        project: Google Cloud project ID.
+        location: Google Cloud region.
+
+    Returns:
+        vertexai.Client shared by every get_agent_engine implementation.
+    """
+    return vertexai.Client(project=project, location=location)
+
+
+# Agent engine IDs created by this process, keyed by (project, location, config)
+_memory_bank_engine_ids: dict[tuple[str, str, str], str] = {}
+# One lock per key, held across its creation so other configs aren't blocked;
+# callers run in asyncio.to_thread workers
+_memory_bank_engine_locks: dict[tuple[str, str, str], threading.Lock] = {}
+_memory_bank_engine_locks_lock = threading.Lock()
+
+
+def get_or_create_memory_bank_engine(
+    project: str, location: str, customization_configs: Optional[List[Dict]] = None
+) -> str:
+    """Return an agent engine with this memory bank config, creating it once.
+
+    Executors in the same process that ask for the same config share one
+    engine. Separate processes or deployments each create their own; set the
+    executor's memory_bank_engine_env variable (e.g. COCKTAIL_MEMORY_ENGINE_ID)
+    to have them reuse an existing engine instead.
+
+    Args:
+        project: Google Cloud project ID.
+        location: Google Cloud region.
+        customization_configs: Optional memory bank customization configs.
+
+    Returns:
+        str: Agent engine ID
+    """
+    memory_bank_config = {
+        "generation_config": {
+            "model": (
+                f"projects/{project}/locations/{location}/"
+                "publishers/google/models/gemini-2.5-flash"
+            )
+        }
+    }
+    if customization_configs:
+        memory_bank_config["customization_configs"] = customization_configs
+
+    cache_key = (project, location, json.dumps(memory_bank_config, sort_keys=True))
+    with _memory_bank_engine_locks_lock:
+        lock = _memory_bank_engine_locks.setdefault(cache_key, threading.Lock())
+    with lock:
+        if cache_key in _memory_bank_engine_ids:
+            return _memory_bank_engine_ids[cache_key]
+
+        client = get_agent_engine_client(project, location)
+        agent_engine = client.agent_engines.create(
+            config={"context_spec": {"memory_bank_config": memory_bank_config}}
+        )
+        agent_engine_id = agent_engine.api_resource.name.split("/")[-1]
+        logger.info("Created agent engine %s", agent_engine_id)
+        _memory_bank_engine_ids[cache_key] = agent_engine_id
+        return agent_engine_id
+
+
+@functools.lru_cache(maxsize=32)
+def get_memory_service(
+    project: str, location: str, agent_engine_id: str
+) -> PersistentVertexAiMemoryBankService:
+    """Return the shared memory bank service for an agent engine.
+
+    Args:
+        project: Google Cloud project ID.
+        location: Google Cloud region.
+        agent_engine_id: Agent engine that owns the memory bank.
+
+    Returns:
+        PersistentVertexAiMemoryBankService shared by all executors in the process.
+    """
+    return PersistentVertexAiMemoryBankService(
+        project=project, location=location, agent_engine_id=agent_engine_id
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def get_session_service(
+    project: str, location: str, agent_engine_id: str
+) -> VertexAiSessionService:
+    """Return the shared session service for an agent engine.
+
+    Args:
+        project: Google Cloud project ID.
+        location: Google Cloud region.
+        agent_engine_id: Agent engine that owns the sessions.
+
+    Returns:
+        VertexAiSessionService shared by all executors in the process.
+    """
+    return VertexAiSessionService(
+        project=project, location=location, agent_engine_id=agent_engine_id
+    )
+
+
+# Process-wide OIDC token cache: audience -> (Authorization header, expiry).
+# Shared by every TokenManager so executors for the same MCP server reuse one
+# token instead of each minting their own.
+_TOKEN_CACHE: Dict[str, tuple[str, float]] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+# Fallback lifetime when a token's exp claim can't be read.
+DEFAULT_TOKEN_LIFETIME_SECONDS = 3600
+
+
+def _token_lifetime_seconds(auth_header: str) -> float:
+    """
+    Return the remaining lifetime of a bearer token from its exp claim.
+
+    Args:
+        auth_header: Authorization header value of the form "Bearer <jwt>".
+
+    Returns:
+        Seconds until the token expires, or DEFAULT_TOKEN_LIFETIME_SECONDS if
+        the claim can't be decoded.
+    """
+    token = auth_header.removeprefix("Bearer ")
+    try:
+        claims = google_auth_jwt.decode(token, verify=False)
+        return claims["exp"] - time.time()
+    except (ValueError, KeyError, TypeError):
+        logger.warning("Could not read exp claim from OIDC token, assuming 1 hour")
+        return DEFAULT_TOKEN_LIFETIME_SECONDS
+
+
+# Longest text kept per part when a session is sent to Memory Bank.
+MEMORY_EVENT_TEXT_LIMIT = 2000
+
+
+def _trim_session_for_memory(session: Session) -> Session:
+    """
+    Return a copy of the session holding only what memory generation needs.
+
+    Tool calls, tool responses and other non-text parts are dropped and long
+    text is truncated, so large MCP payloads are not re-sent to Memory Bank.
+
+    Args:
+        session: The session to trim. It is not modified.
+
+    Returns:
+        A shallow copy of the session with trimmed events.
+    """
+    events = []
+    for event in session.events:
+        if not event.content or not event.content.parts:
+            continue
+        parts = [
+            types.Part(text=part.text[:MEMORY_EVENT_TEXT_LIMIT])
+            for part in event.content.parts
+            if part.text
+        ]
+        if parts:
+            content = types.Content(role=event.content.role, parts=parts)
+            events.append(event.model_copy(update={"content": content}))
+    return session.model_copy(update={"events": events})
+
+
 class TokenManager:
     """Manages OIDC token with automatic refresh on expiry."""
 
@@ -144,30 +353,93 @@ class TokenManager:
         Returns:
             Dictionary with Authorization header, or empty dict if auth unavailable.
         """
-        current_time = time.time()
-
-        # Refresh if token is None or about to expire
-        if self._token is None or self._expiry is None or current_time >= self._expiry:
-            headers = get_gcp_auth_headers(self.audience)
-            auth_header = headers.get("Authorization")
-
-            if auth_header:
-                self._token = auth_header
-                # ID tokens typically expire in 1 hour (3600 seconds)
-                # Refresh 5 minutes (300 seconds) before expiry by default
-                self._expiry = current_time + 3600 - self.refresh_buffer_seconds
-                logging.info(
-                    f"TokenManager: Refreshed token, next refresh at {self._expiry}"
-                )
-            else:
-                # No token available
-                self._token = None
-                self._expiry = None
+        # Monotonic clock so NTP adjustments can't skew refresh timing
+        current_time = time.monotonic()
+
+        # Fast path: a still-valid cached token needs no lock
+        cached = _TOKEN_CACHE.get(self.audience)
+        if cached is not None and current_time < cached[1]:
+            self._token, self._expiry = cached
+            return {"Authorization": self._token}
+
+        with _TOKEN_CACHE_LOCK:
+            # Re-check under the lock; another caller may have just refreshed
+            cached = _TOKEN_CACHE.get(self.audience)
+
+            # Refresh if no token is cached for this audience or it is about to expire
+            if cached is None or current_time >= cached[1]:
+                headers = get_gcp_auth_headers(self.audience)
+                auth_header = headers.get("Authorization")
+
+                if auth_header:
+                    # Expiry comes from the token's own exp claim
+                    # Refresh 5 minutes (300 seconds) before expiry by default,
+                    # with +/-10% jitter so executors started together don't
+                    # all refresh at the same moment
+                    jitter = random.uniform(-0.1, 0.1) * self.refresh_buffer_seconds
+                    cached = (
+                        auth_header,
+                        current_time
+                        + _token_lifetime_seconds(auth_header)
+                        - self.refresh_buffer_seconds
+                        + jitter,
+                    )
+                    _TOKEN_CACHE[self.audience] = cached
+                    logger.info(
+                        "TokenManager: Refreshed token, next refresh at %s", cached[1]
+                    )
+                else:
+                    # No token available
+                    cached = None
+                    _TOKEN_CACHE.pop(self.audience, None)
+
+        self._token, self._expiry = cached if cached else (None, None)
 
         # Return current token
         return {"Authorization": self._token} if self._token else {}
 
 
+class CachedMcpToolset(McpToolset):
+    """McpToolset that reuses the discovered tool list between agent runs.
+
+    The stock toolset issues a ``tools/list`` request to the MCP server every
+    time the agent runs. The server's tools only change on redeploy, so the
+    result is kept for ``cache_ttl_seconds`` before being fetched again.
+    """
+
+    def __init__(self, *args, cache_ttl_seconds: float = 3600, **kwargs):
+        """
+        Initialize CachedMcpToolset.
+
+        Args:
+            cache_ttl_seconds: How long a discovered tool list is reused.
+            *args: Positional arguments forwarded to McpToolset.
+            **kwargs: Keyword arguments forwarded to McpToolset.
+        """
+        super().__init__(*args, **kwargs)
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._cached_tools: Optional[List[BaseTool]] = None
+        self._cached_at = 0.0
+
+    async def get_tools(
+        self, readonly_context: Optional[ReadonlyContext] = None
+    ) -> List[BaseTool]:
+        """Return the cached tool list, fetching it from the server when stale."""
+        now = time.monotonic()
+        if (
+            self._cached_tools is None
+            or now - self._cached_at >= self._cache_ttl_seconds
+        ):
+            self._cached_tools = await super().get_tools(readonly_context)
+            self._cached_at = now
+            logger.info(
+                "Discovered %d MCP tools, caching for %ss",
+                len(self._cached_tools),
+                self._cache_ttl_seconds,
+            )
+        return self._cached_tools
+
+
 class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
     """Base Agent Executor that bridges A2A protocol with ADK agents using MCP tools.
 
@@ -179,30 +451,57 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
     5. MCP authentication and token management
     """
 
+    # Environment variable holding an existing memory bank engine ID for this
+    # executor type. Each type has its own memory topics, so it must not share
+    # an engine with another type.
+    memory_bank_engine_env: Optional[str] = None
+
     def __init__(self, agent_engine_id: str = None) -> None:
         """Initialize with lazy loading pattern.
 
         Args:
-            agent_engine_id: Optional agent engine ID. If not provided, creates a new one.
+            agent_engine_id: Optional agent engine ID. Defaults to the
+              memory_bank_engine_env environment variable; if neither is set,
+              one is created on first use.
         """
         self.agent = None
         self.runner = None
         self.token_manager = None
+        self._last_applied_token = None
+        self._mcp_toolsets: list[McpToolset] = []
+        self._sessions = SessionCache()
+        self._memory_tasks: set[asyncio.Task] = set()
+        self._init_lock = asyncio.Lock()
+        # Reuse an existing engine when configured; creating one is a slow RPC
+        if agent_engine_id is None and self.memory_bank_engine_env:
+            agent_engine_id = os.environ.get(self.memory_bank_engine_env) or None
         self.agent_engine_id = agent_engine_id
 
+        # Read once and fail fast; both are needed for every Vertex AI call
         self.project_id = os.environ.get("PROJECT_ID")
         self.location = os.environ.get("LOCATION")
-
-        if self.agent_engine_id is None:
-            self.agent_engine_id = self.get_agent_engine()
+        missing = [
+            name
+            for name, value in (
+                ("PROJECT_ID", self.project_id),
+                ("LOCATION", self.location),
+            )
+            if not value
+        ]
+        if missing:
+            raise ValueError(
+                f"Required environment variable(s) {', '.join(missing)} not set. "
+                "Please set them to the Google Cloud project and region."
+            )
 
     @abstractmethod
-    def get_agent_config(self) -> Dict:
+    def get_agent_config(self) -> Mapping[str, str]:
         """
-        Return agent configuration dictionary.
+        Return agent configuration mapping.
 
         Returns:
-            Dict with keys: name, description, instruction, model, mcp_url_env_var
+            Read-only mapping with keys: name, description, instruction, model,
+            mcp_url_env_var
         """
         pass
 
@@ -216,52 +515,19 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
         Returns:
             str: Agent engine ID
         """
-        import vertexai
-
-        client = vertexai.Client(
-            project=self.project_id,
-            location=self.location,
-        )
+        return get_or_create_memory_bank_engine(self.project_id, self.location)
 
-        agent_engine = client.agent_engines.create(
-            config={
-                "context_spec": {
-                    "memory_bank_config": {
-                        "generation_config": {
-                            "model": (
-                                f"projects/{self.project_id}/locations/{self.location}/"
-                                "publishers/google/models/gemini-2.5-flash"
-                            )
-                        }
-                    }
-                }
-            }
-        )
-        agent_engine_id = agent_engine.api_resource.name.split("/")[-1]
-        return agent_engine_id
-
-    def _init_agent(self) -> None:
+    async def _init_agent(self) -> None:
         """
         Lazy initialization of agent resources.
         This constructs the agent and its token manager using the config.
+        The memory service, session service and initial OIDC token are
+        independent network calls, so they are fetched concurrently.
         """
         if self.agent is None:
             # Get agent configuration
             config = self.get_agent_config()
 
-            # Use custom memory service that keeps httpx client alive
-            my_memory_service = PersistentVertexAiMemoryBankService(
-                project=os.environ.get("PROJECT_ID"),
-                location=os.environ.get("LOCATION"),
-                agent_engine_id=self.agent_engine_id,
-            )
-
-            my_session_service = VertexAiSessionService(
-                project=os.environ.get("PROJECT_ID"),
-                location=os.environ.get("LOCATION"),
-                agent_engine_id=self.agent_engine_id,
-            )
-
             # --- Environment setup ---
             mcp_url = os.getenv(config["mcp_url_env_var"])
 
@@ -271,9 +537,32 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
                     f"Please set it to the MCP server URL for {config['name']}."
                 )
 
+            # Create the agent engine on first use rather than at construction
+            if self.agent_engine_id is None:
+                self.agent_engine_id = await asyncio.to_thread(self.get_agent_engine)
+
             # Initialize token manager for automatic token refresh
             self.token_manager = TokenManager(audience=mcp_url)
-            mcp_auth_headers = self.token_manager.get_headers()
+
+            # Use custom memory service that keeps httpx client alive
+            my_memory_service, my_session_service, mcp_auth_headers = (
+                await asyncio.gather(
+                    asyncio.to_thread(
+                        get_memory_service,
+                        self.project_id,
+                        self.location,
+                        self.agent_engine_id,
+                    ),
+                    asyncio.to_thread(
+                        get_session_service,
+                        self.project_id,
+                        self.location,
+                        self.agent_engine_id,
+                    ),
+                    asyncio.to_thread(self.token_manager.get_headers),
+                )
+            )
+            self._last_applied_token = mcp_auth_headers.get("Authorization")
 
             mcp_server_params = StreamableHTTPConnectionParams(
                 url=mcp_url,
@@ -291,25 +580,41 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
 
                 Memory topics are configured in the agent engine (see get_agent_engine method).
                 Subclasses can override get_agent_engine to customize memory topics.
+
+                Memory generation runs as a background task so the callback
+                returns immediately and the request is not held open for it.
+                Only the text of each event is sent, truncated per part.
                 """
                 session = callback_context._invocation_context.session
                 memory_service = callback_context._invocation_context.memory_service
 
-                logging.info(
-                    f"Saving session {session.id} to memory bank for "
-                    f"user_id={session.user_id}"
+                logger.info(
+                    "Saving session %s to memory bank for user_id=%s",
+                    session.id,
+                    session.user_id,
                 )
 
-                try:
-                    await memory_service.add_session_to_memory(session)
-                    logging.info(
-                        f"Memory generation completed for session {session.id}"
-                    )
-                except Exception as e:
-                    logging.error(
-                        f"Memory generation failed for session {session.id}: {e}",
-                        exc_info=True,
-                    )
+                # Snapshot now; the live session keeps changing after we return
+                trimmed_session = _trim_session_for_memory(session)
+
+                async def save_session_to_memory():
+                    try:
+                        await memory_service.add_session_to_memory(trimmed_session)
+                        logger.info(
+                            "Memory generation completed for session %s", session.id
+                        )
+                    except Exception as e:
+                        logger.error(
+                            "Memory generation failed for session %s: %s",
+                            session.id,
+                            e,
+                            exc_info=True,
+                        )
+
+                # Keep a reference so the task is not garbage collected mid-flight
+                task = asyncio.create_task(save_session_to_memory())
+                self._memory_tasks.add(task)
+                task.add_done_callback(self._memory_tasks.discard)
 
             # Create the actual agent
             self.agent = LlmAgent(
@@ -318,7 +623,7 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
                 description=config["description"],
                 instruction=config["instruction"],
                 tools=[
-                    McpToolset(
+                    CachedMcpToolset(
                         connection_params=mcp_server_params,
                     ),
                     adk.tools.preload_memory_tool.PreloadMemoryTool(),
@@ -333,13 +638,18 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
                 agent=self.agent,
                 # In-memory services for simplicity
                 # In production, you might use persistent storage
-                artifact_service=InMemoryArtifactService(),
+                artifact_service=BoundedArtifactService(),
                 # session_service=InMemorySessionService(),
                 # memory_service=InMemoryMemoryService(),
                 session_service=my_session_service,
                 memory_service=my_memory_service,
             )
 
+            # Toolsets whose auth headers are rotated by _refresh_mcp_auth
+            self._mcp_toolsets = [
+                tool for tool in self.agent.tools if isinstance(tool, McpToolset)
+            ]
+
     async def execute(
         self,
         context: RequestContext,
@@ -351,13 +661,16 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
         1. A new message arrives (message/send)
         2. A streaming request is made (message/stream)
         """
-        # Initialize agent on first call
+        # Initialize agent on first call; the lock keeps concurrent first
+        # requests from building duplicate toolsets and runners
         if self.agent is None:
-            self._init_agent()
+            async with self._init_lock:
+                if self.agent is None:
+                    await self._init_agent()
 
         # Extract the user's question from the protocol message
         query = context.get_user_input()
-        logging.info(f"Received query: {query}")
+        logger.info("Received query: %s", query)
 
         # Create a TaskUpdater for managing task state
         updater = TaskUpdater(event_queue, context.task_id, context.context_id)
@@ -377,10 +690,13 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
         try:
             # Get or create a session for this conversation
             session = await self._get_or_create_session(context.context_id)
-            logging.info(f"Using session: {session.id}")
+            logger.info("Using session: %s", session.id)
 
             # Prepare the user message in ADK format
-            content = types.Content(role=Role.user, parts=[types.Part(text=query)])
+            # Fields are already valid, so skip pydantic validation
+            content = types.Content.model_construct(
+                role=_USER_ROLE, parts=[types.Part.model_construct(text=query)]
+            )
 
             # Run the agent asynchronously
             # This may involve multiple LLM calls and tool uses
@@ -395,7 +711,7 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
                 if event.is_final_response() and not answer_sent:
                     # Extract the answer text from the response
                     answer = self._extract_answer(event)
-                    logging.info(f" {answer}")
+                    logger.info(" %s", answer)
 
                     # Add the answer as an artifact
                     # Artifacts are the "outputs" or "results" of a task
@@ -408,12 +724,13 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
                     # Mark task as completed successfully
                     await updater.complete()
                     answer_sent = True
-                    # Don't break - continue consuming events to allow callbacks to execute
+                    # Don't break - the after-agent callback only runs once the
+                    # stream is drained; it just schedules the memory save
 
         except Exception as e:
             # Errors should never pass silently (Zen of Python)
             # Always inform the client when something goes wrong
-            logging.error(f"Error during execution: {e!s}", exc_info=True)
+            logger.error("Error during execution: %s", e, exc_info=True)
             await updater.update_status(
                 TaskState.failed, message=new_agent_text_message(f"Error: {e!s}")
             )
@@ -423,40 +740,54 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
     def _refresh_mcp_auth(self) -> None:
         """Refresh MCP authentication headers using the token manager."""
         if self.token_manager is None:
-            logging.warning("TokenManager not initialized, skipping auth refresh")
+            logger.warning("TokenManager not initialized, skipping auth refresh")
             return
 
         # Get fresh headers from token manager (will auto-refresh if expired)
         fresh_headers = self.token_manager.get_headers()
 
+        # Nothing to do until the token manager hands out a different token
+        fresh_token = fresh_headers.get("Authorization")
+        if fresh_token == self._last_applied_token:
+            return
+
         # Update the toolset connection params (using private attribute)
-        for tool in self.agent.tools:
-            if isinstance(tool, McpToolset):
-                # Access private attribute to update headers
-                if hasattr(tool._connection_params, "headers"):
-                    tool._connection_params.headers = fresh_headers
-                    logging.debug("Refreshed MCP authentication headers")
+        for tool in self._mcp_toolsets:
+            tool._connection_params.headers = fresh_headers
+        self._last_applied_token = fresh_token
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Refreshed MCP authentication headers")
 
     async def _get_or_create_session(self, context_id: str):
-        """Get existing session or create new one."""
-        # For Vertex AI Session Service, don't pass session_id to get_session
-        # Instead, create a new session each time (stateless per A2A context)
-        logging.info(f"Creating new session for context {context_id}.")
-        session = await self.runner.session_service.create_session(
-            app_name=self.runner.app_name,
-            user_id="user",
-            # Don't pass session_id - let Vertex AI generate a valid one
-        )
+        """Get existing session or create new one.
 
-        return session
+        Vertex AI generates its own session IDs, so the session created for a
+        context_id is cached and reused for follow-up turns until it expires.
+        """
+
+        async def create() -> Session:
+            # For Vertex AI Session Service, don't pass session_id to get_session
+            # Instead, create a new session (stateless per A2A context)
+            logger.info("Creating new session for context %s.", context_id)
+            return await self.runner.session_service.create_session(
+                app_name=self.runner.app_name,
+                user_id="user",
+                # Don't pass session_id - let Vertex AI generate a valid one
+            )
+
+        return await self._sessions.get_or_create(context_id, create)
 
     def _extract_answer(self, event) -> str:
         """Extract text answer from agent response."""
         parts = event.content.parts
-        text_parts = [part.text for part in parts if part.text]
+
+        # Most final responses carry a single text part
+        if len(parts) == 1 and parts[0].text:
+            return parts[0].text
 
         # Join all text parts with space
-        return " ".join(text_parts) if text_parts else "No answer found."
+        answer = " ".join(filter(None, (part.text for part in parts)))
+        return answer or "No answer found."
 
     async def cancel(
         self, context: RequestContext, event_queue: EventQueue
@@ -468,8 +799,8 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
         2. Clean up resources
         3. Update task state to 'cancelled'
         """
-        logging.warning(
-            f"Cancellation requested for task {context.task_id}, but not supported."
+        logger.warning(
+            "Cancellation requested for task %s, but not supported.", context.task_id
         )
         # Inform client that cancellation isn't supported
         raise ServerError(error=UnsupportedOperationError())
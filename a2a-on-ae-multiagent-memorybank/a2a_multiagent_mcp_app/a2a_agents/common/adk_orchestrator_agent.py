@@ -16,6 +16,7 @@ import asyncio
 import base64
 import json
 import logging
+import time
 import uuid
 
 import httpx
@@ -31,7 +32,6 @@ from a2a.types import (
     TextPart,
     TransportProtocol,
 )
-from dotenv import load_dotenv
 from google import adk
 from google.adk import Agent
 from google.adk.agents.callback_context import CallbackContext
@@ -39,13 +39,54 @@ from google.adk.agents.readonly_context import ReadonlyContext
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types
 
-from common.remote_connection import RemoteAgentConnections, TaskUpdateCallback
+from common.http_client import get_shared_client
+from common.remote_connection import (
+    TERMINAL_STATES,
+    RemoteAgentConnections,
+    TaskUpdateCallback,
+)
+from common.single_flight import SingleFlight
 
 # from google.adk.models.lite_llm import LiteLlm
 
 logger = logging.getLogger(__name__)
 
-load_dotenv()
+
+# Agent cards change only on redeploy, so fetched cards are reused for an hour.
+CARD_TTL_SECONDS = 3600
+
+# Process-wide agent card cache: address -> (fetched at, card).
+_CARD_CACHE: dict[str, tuple[float, AgentCard]] = {}
+
+# Invariant head of the orchestrator instruction; the agents list and the
+# active agent are appended to it.
+ROOT_INSTRUCTION_HEAD = """You are an expert delegator that can delegate the user request to the
+appropriate remote agents.
+
+Discovery:
+- You can use `list_remote_agents` to list the available remote agents you
+can use to delegate the task.
+
+Execution:
+- For actionable requests, you can use `send_message` to interact with remote agents to take action.
+- When a request needs more than one remote agent, call `send_message` for each of
+them in the same turn so the calls run in parallel.
+- You could use tools to check previous conversations, and relay information in response to user queries.
+
+Be sure to include the remote agent name when you respond to the user.
+
+Please rely on tools to address the request, and don't make up the response. If you are not sure, please ask the user for more details.
+Focus on the most recent parts of the conversation primarily.
+
+Agents:
+"""
+
+# Upper bound on agent card fetches in flight at once.
+MAX_CONCURRENT_CARD_FETCHES = 16
+
+
+# Memory generation tasks still in flight.
+_PENDING_MEMORY_TASKS: set[asyncio.Task] = set()
 
 
 async def auto_save_session_to_memory_callback(callback_context: CallbackContext):
@@ -55,7 +96,8 @@ async def auto_save_session_to_memory_callback(callback_context: CallbackContext
     This callback is triggered after the agent completes processing.
     It extracts conversation events from the session and sends them to
     the Memory Bank service for processing. The service generates semantic
-    memories that can be retrieved in future conversations.
+    memories that can be retrieved in future conversations. Generation runs
+    as a background task so the callback returns immediately.
 
     Args:
         callback_context: The callback context containing session and memory service.
@@ -63,18 +105,60 @@ async def auto_save_session_to_memory_callback(callback_context: CallbackContext
     session = callback_context._invocation_context.session
     memory_service = callback_context._invocation_context.memory_service
 
-    logging.info(
-        f"Saving session {session.id} to memory bank for user_id={session.user_id}"
+    logger.info(
+        "Saving session %s to memory bank for user_id=%s", session.id, session.user_id
     )
 
-    try:
-        await memory_service.add_session_to_memory(session)
-        logging.info(f"Memory generation completed for session {session.id}")
-    except Exception as e:
-        logging.error(
-            f"Memory generation failed for session {session.id}: {e}",
-            exc_info=True,
+    async def save_session_to_memory():
+        try:
+            await memory_service.add_session_to_memory(session)
+            logger.info("Memory generation completed for session %s", session.id)
+        except Exception as e:
+            logger.error(
+                "Memory generation failed for session %s: %s",
+                session.id,
+                e,
+                exc_info=True,
+            )
+
+    # Run in the background so the response isn't held for memory generation;
+    # keep a reference so the task is not garbage collected mid-flight
+    task = asyncio.create_task(save_session_to_memory())
+    _PENDING_MEMORY_TASKS.add(task)
+    task.add_done_callback(_PENDING_MEMORY_TASKS.discard)
+
+
+# ClientFactory per httpx client. Each factory holds its client, so entries
+# live for the process; orchestrators all use the shared client anyway.
+_CLIENT_FACTORIES: dict[httpx.AsyncClient, ClientFactory] = {}
+
+
+def _get_client_factory(http_client: httpx.AsyncClient | None) -> ClientFactory:
+    """Returns the A2A client factory for an httpx client, creating it once.
+
+    Args:
+        http_client: The httpx client the factory's clients send through.
+
+    Returns:
+        A ClientFactory shared by every orchestrator using the same client.
+    """
+    client_factory = (
+        _CLIENT_FACTORIES.get(http_client) if http_client is not None else None
+    )
+    if client_factory is None:
+        # Prefer HTTP+JSON over JSON-RPC to skip the envelope on every call
+        config = ClientConfig(
+            httpx_client=http_client,
+            supported_transports=[
+                TransportProtocol.http_json,
+                TransportProtocol.jsonrpc,
+            ],
+            use_client_preference=True,
         )
+        client_factory = ClientFactory(config)
+        if http_client is not None:
+            _CLIENT_FACTORIES[http_client] = client_factory
+    return client_factory
 
 
 class AdkOrchestratorAgent:
@@ -99,19 +183,17 @@ class AdkOrchestratorAgent:
         """
         self.task_callback = task_callback
         self.httpx_client = http_client
-        config = ClientConfig(
-            httpx_client=self.httpx_client,
-            supported_transports=[
-                TransportProtocol.jsonrpc,
-                TransportProtocol.http_json,
-            ],
-        )
-        client_factory = ClientFactory(config)
-        self.client_factory = client_factory
+        self.client_factory = _get_client_factory(self.httpx_client)
         self.remote_agent_connections: dict[str, RemoteAgentConnections] = {}
         self.cards: dict[str, AgentCard] = {}
         self.agents: str = ""
+        # Serialized card summary per agent name, joined into self.agents
+        self._agent_info_lines: dict[str, str] = {}
+        # Instruction up to the active agent, rebuilt when agents change
+        self._instruction_prefix = self._build_instruction_prefix()
         self._init_task = None
+        # In-flight remote sends keyed by (invocation id, agent name, text)
+        self._single_flight = SingleFlight()
         self._remote_agent_addresses = remote_agent_addresses
 
     async def init_remote_agent_addresses(self, remote_agent_addresses: list[str]):
@@ -120,25 +202,43 @@ class AdkOrchestratorAgent:
         Args:
             remote_agent_addresses: A list of remote agent addresses.
         """
+        # Bound concurrent fetches so a long address list can't exhaust the
+        # httpx connection pool
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CARD_FETCHES)
+
+        async def retrieve_card_bounded(address: str) -> AgentCard:
+            async with semaphore:
+                return await self.retrieve_card(address)
+
         # Use asyncio.gather for Python 3.10 compatibility (TaskGroup is 3.11+)
-        tasks = [self.retrieve_card(address) for address in remote_agent_addresses]
-        await asyncio.gather(*tasks)
+        tasks = [retrieve_card_bounded(address) for address in remote_agent_addresses]
+        cards = await asyncio.gather(*tasks)
+        self.register_agent_cards(cards)
         # Once completed the self.agents string is set and the remote
         # connections are established.
 
-    async def retrieve_card(self, address: str):
+    async def retrieve_card(self, address: str) -> AgentCard:
         """Retrieves the agent card from the given address.
 
         Args:
             address: The address of the agent.
+
+        Returns:
+            The agent card.
         """
-        card_resolver = A2ACardResolver(
-            self.httpx_client, base_url=address, agent_card_path="/v1/card"
-        )
-        card = await card_resolver.get_agent_card()
+        cached = _CARD_CACHE.get(address)
+        if cached is not None and time.monotonic() - cached[0] < CARD_TTL_SECONDS:
+            card = cached[1]
+            logger.info("Using cached card for %s from %s", card.name, address)
+        else:
+            card_resolver = A2ACardResolver(
+                self.httpx_client, base_url=address, agent_card_path="/v1/card"
+            )
+            card = await card_resolver.get_agent_card()
+            _CARD_CACHE[address] = (time.monotonic(), card)
+            logger.info("Retrieved card for %s from %s", card.name, address)
 
-        logger.info(f"Retrieved card for {card.name} from {address}")
-        self.register_agent_card(card)
+        return card
 
     def register_agent_card(self, card: AgentCard):
         """Registers the agent card.
@@ -146,13 +246,28 @@ class AdkOrchestratorAgent:
         Args:
             card: The agent card to register.
         """
-        remote_connection = RemoteAgentConnections(self.client_factory, card)
-        self.remote_agent_connections[card.name] = remote_connection
-        self.cards[card.name] = card
-        agent_info = []
-        for ra in self.list_remote_agents():
-            agent_info.append(json.dumps(ra))
-        self.agents = "\n".join(agent_info)
+        self.register_agent_cards([card])
+
+    def register_agent_cards(self, cards: list[AgentCard]):
+        """Registers a batch of agent cards, rebuilding self.agents once.
+
+        Args:
+            cards: The agent cards to register.
+        """
+        for card in cards:
+            remote_connection = RemoteAgentConnections(self.client_factory, card)
+            self.remote_agent_connections[card.name] = remote_connection
+            self.cards[card.name] = card
+            self._agent_info_lines[card.name] = json.dumps(
+                {"name": card.name, "description": card.description},
+                separators=(",", ":"),
+            )
+        self.agents = "\n".join(self._agent_info_lines.values())
+        self._instruction_prefix = self._build_instruction_prefix()
+
+    def _build_instruction_prefix(self) -> str:
+        """Builds the part of the root instruction that only changes with agents."""
+        return f"{ROOT_INSTRUCTION_HEAD}{self.agents}\n\nCurrent agent: "
 
     def create_agent(self) -> Agent:
         """Creates the orchestrator agent."""
@@ -174,27 +289,7 @@ class AdkOrchestratorAgent:
         )
 
     def root_instruction(self, context: ReadonlyContext) -> str:
-        current_agent = self.check_state(context)
-        return f"""You are an expert delegator that can delegate the user request to the
-appropriate remote agents.
-
-Discovery:
-- You can use `list_remote_agents` to list the available remote agents you
-can use to delegate the task.
-
-Execution:
-- For actionable requests, you can use `send_message` to interact with remote agents to take action.
-- You could use tools to check previous conversations, and relay information in response to user queries.
-
-Be sure to include the remote agent name when you respond to the user.
-
-Please rely on tools to address the request, and don't make up the response. If you are not sure, please ask the user for more details.
-Focus on the most recent parts of the conversation primarily.
-
-Agents:
-{self.agents}
-
-Current agent: {current_agent["active_agent"]} """
+        return f"{self._instruction_prefix}{self._active_agent_name(context)} "
 
     def check_state(self, context: ReadonlyContext) -> dict[str, str]:
         """Checks the state of the agent.
@@ -205,6 +300,14 @@ Current agent: {current_agent["active_agent"]} """
         Returns:
             A dictionary with the active agent.
         """
+        return {"active_agent": self._active_agent_name(context)}
+
+    def _active_agent_name(self, context: ReadonlyContext) -> str:
+        """Returns the name of the active remote agent, or "None".
+
+        Args:
+            context: The readonly context.
+        """
         state = context.state
         if (
             "context_id" in state
@@ -212,8 +315,8 @@ Current agent: {current_agent["active_agent"]} """
             and state["session_active"]
             and "agent" in state
         ):
-            return {"active_agent": f"{state['agent']}"}
-        return {"active_agent": "None"}
+            return f"{state['agent']}"
+        return "None"
 
     def before_model_callback(self, callback_context: CallbackContext, llm_request):
         """A callback that is called before the model is called.
@@ -259,7 +362,9 @@ Current agent: {current_agent["active_agent"]} """
         if agent_name not in self.remote_agent_connections:
             raise ValueError(f"Agent {agent_name} not found")
         state = tool_context.state
-        state["agent"] = agent_name
+        # Only write on change; each state write is recorded in the session delta
+        if state.get("agent") != agent_name:
+            state["agent"] = agent_name
         client = self.remote_agent_connections[agent_name]
         if not client:
             raise ValueError(f"Client not available for {agent_name}")
@@ -268,7 +373,7 @@ Current agent: {current_agent["active_agent"]} """
         message_id = state.get("message_id", None)
         task: Task
         if not message_id:
-            message_id = str(uuid.uuid4())
+            message_id = uuid.uuid4().hex
 
         request_message = Message(
             role=Role.user,
@@ -277,19 +382,42 @@ Current agent: {current_agent["active_agent"]} """
             context_id=context_id,
             task_id=task_id,
         )
-        response = await client.send_message(request_message)
+
+        async def send_and_convert() -> list:
+            response = await client.send_message(request_message)
+            return await self._convert_response(agent_name, response, tool_context)
+
+        # Identical calls are only shared within one invocation, never across
+        # users or turns. Joiners get the converted result, so file parts are
+        # saved as artifacts only once.
+        return await self._single_flight.run(
+            (tool_context.invocation_id, agent_name, message), send_and_convert
+        )
+
+    async def _convert_response(
+        self,
+        agent_name: str,
+        response: Task | Message | None,
+        tool_context: ToolContext,
+    ) -> list:
+        """Records a remote agent's reply in the session state and converts it.
+
+        Args:
+          agent_name: The name of the agent that replied.
+          response: The task or message the agent replied with.
+          tool_context: The tool context of the send.
+
+        Returns:
+          The converted parts of the reply.
+        """
+        state = tool_context.state
         if isinstance(response, Message):
             logger.info("Got message object from remote agent")
-            logger.debug(f"Message content: {response}")
+            logger.debug("Message content: %s", response)
             return await convert_parts(response.parts, tool_context)
         task: Task = response
         # Assume completion unless a state returns that isn't complete
-        state["session_active"] = task.status.state not in [
-            TaskState.completed,
-            TaskState.canceled,
-            TaskState.failed,
-            TaskState.unknown,
-        ]
+        state["session_active"] = task.status.state not in TERMINAL_STATES
         if task.context_id:
             state["context_id"] = task.context_id
         state["task_id"] = task.id
@@ -325,10 +453,12 @@ async def convert_parts(parts: list[Part], tool_context: ToolContext) -> list:
     Returns:
         A list of converted parts.
     """
-    rval = []
-    for p in parts:
-        rval.append(await convert_part(p, tool_context))
-    return rval
+    # Common case: plain text relays need no awaiting at all
+    if all(p.root.kind == "text" for p in parts):
+        return [p.root.text for p in parts]
+
+    # File parts save artifacts, so convert concurrently; gather keeps order
+    return list(await asyncio.gather(*(convert_part(p, tool_context) for p in parts)))
 
 
 async def convert_part(part: Part, tool_context: ToolContext) -> str | DataPart | dict:
@@ -341,23 +471,44 @@ async def convert_part(part: Part, tool_context: ToolContext) -> str | DataPart
     Returns:
         The converted part (string, DataPart, or dict).
     """
-    if part.root.kind == "text":
-        return part.root.text
-    if part.root.kind == "data":
-        return part.root.data
-    if part.root.kind == "file":
-        # Repackage A2A FilePart to google.genai Blob
-        # Currently not considering plain text as files
-        file_id = part.root.file.name
-        file_bytes = base64.b64decode(part.root.file.bytes)
-        file_part = types.Part(
-            inline_data=types.Blob(mime_type=part.root.file.mime_type, data=file_bytes)
-        )
-        await tool_context.save_artifact(file_id, file_part)
-        tool_context.actions.skip_summarization = True
-        tool_context.actions.escalate = True
-        return DataPart(data={"artifact-file-id": file_id})
-    return f"Unknown type: {part.kind}"
+    converter = _PART_CONVERTERS.get(part.root.kind)
+    if converter is None:
+        return f"Unknown type: {part.root.kind}"
+    return await converter(part, tool_context)
+
+
+async def _convert_text_part(part: Part, tool_context: ToolContext) -> str:
+    """Returns the text of a text part."""
+    return part.root.text
+
+
+async def _convert_data_part(part: Part, tool_context: ToolContext) -> dict:
+    """Returns the payload of a data part."""
+    return part.root.data
+
+
+async def _convert_file_part(part: Part, tool_context: ToolContext) -> DataPart:
+    """Saves a file part as an artifact and returns a reference to it."""
+    # Repackage A2A FilePart to google.genai Blob
+    # Currently not considering plain text as files
+    file_id = part.root.file.name
+    # Decode off the event loop; file parts can be several MB
+    file_bytes = await asyncio.to_thread(base64.b64decode, part.root.file.bytes)
+    file_part = types.Part(
+        inline_data=types.Blob(mime_type=part.root.file.mime_type, data=file_bytes)
+    )
+    await tool_context.save_artifact(file_id, file_part)
+    tool_context.actions.skip_summarization = True
+    tool_context.actions.escalate = True
+    return DataPart(data={"artifact-file-id": file_id})
+
+
+# Part kind -> converter used by convert_part.
+_PART_CONVERTERS = {
+    "text": _convert_text_part,
+    "data": _convert_data_part,
+    "file": _convert_file_part,
+}
 
 
 async def get_orchestrator_agent(
@@ -367,14 +518,14 @@ async def get_orchestrator_agent(
 
     Args:
         remote_agent_addresses: A list of remote agent addresses.
-        httpx_client: An httpx client.
+        httpx_client: An httpx client. Defaults to a shared pooled client.
 
     Returns:
         The orchestrator agent.
     """
     orchestrator_agent_wrapper = AdkOrchestratorAgent(
         remote_agent_addresses=remote_agent_addresses,
-        http_client=httpx_client,
+        http_client=httpx_client or get_shared_client(),
     )
 
     # Initialize remote agents before creating the agent
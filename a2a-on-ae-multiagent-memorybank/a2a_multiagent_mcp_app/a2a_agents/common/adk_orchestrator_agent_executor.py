@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # Author: Dave Wang
+import asyncio
 import logging
 import os
 from abc import ABC, abstractmethod
-from typing import NoReturn
+from typing import NoReturn, Optional
 
 import httpx
 
@@ -26,20 +27,61 @@ from a2a.server.tasks import TaskUpdater
 from a2a.types import Role, TaskState, TextPart, UnsupportedOperationError
 from a2a.utils import new_agent_text_message
 from a2a.utils.errors import ServerError
-from dotenv import load_dotenv
 from google.adk import Runner
-from google.adk.artifacts import InMemoryArtifactService
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
-from google.adk.sessions import InMemorySessionService, VertexAiSessionService
+from google.adk.sessions import InMemorySessionService, Session
 from google.genai import types
 
 from common.adk_orchestrator_agent import get_orchestrator_agent
-from common.auth_utils import GoogleAuth
-from common.adk_base_mcp_agent_executor import PersistentVertexAiMemoryBankService
+from common.artifact_service import BoundedArtifactService
+from common.http_client import get_shared_client
+from common.session_cache import SessionCache
+from common.adk_base_mcp_agent_executor import (
+    get_memory_service,
+    get_session_service,
+)
 
-# Set logging
-logging.getLogger().setLevel(logging.INFO)
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Plain string rather than the enum: model_construct skips pydantic's coercion
+_USER_ROLE = Role.user.value
+
+# Orchestrator agents keyed by remote address set. Tasks rather than agents
+# are stored so concurrent cold starts share a single build. Like the shared
+# httpx client the agents send through, they assume the server runs a single
+# event loop for the life of the process.
+_ORCHESTRATOR_AGENTS: dict[frozenset[str], asyncio.Task] = {}
+
+
+async def _get_shared_orchestrator_agent(
+    remote_agent_addresses: list[str], httpx_client: httpx.AsyncClient
+):
+    """Returns the orchestrator agent for these remote agents, building it once.
+
+    Args:
+        remote_agent_addresses: A list of remote agent addresses.
+        httpx_client: The httpx client used to reach the remote agents.
+
+    Returns:
+        The orchestrator agent shared by executors with the same addresses.
+    """
+    key = frozenset(remote_agent_addresses)
+    task = _ORCHESTRATOR_AGENTS.get(key)
+    if task is None:
+        task = asyncio.create_task(
+            get_orchestrator_agent(
+                remote_agent_addresses=remote_agent_addresses,
+                httpx_client=httpx_client,
+            )
+        )
+        _ORCHESTRATOR_AGENTS[key] = task
+    try:
+        return await asyncio.shield(task)
+    except Exception:
+        # Let the next executor retry instead of caching the failure
+        if _ORCHESTRATOR_AGENTS.get(key) is task:
+            del _ORCHESTRATOR_AGENTS[key]
+        raise
 
 
 class AdkOrchestratorAgentExecutor(AgentExecutor, ABC):
@@ -54,6 +96,9 @@ class AdkOrchestratorAgentExecutor(AgentExecutor, ABC):
     5. Agent engine configuration with custom memory topics
     """
 
+    # Environment variable with an existing memory bank engine ID for this type
+    memory_bank_engine_env: Optional[str] = None
+
     def __init__(
         self, remote_agent_addresses: list[str], agent_engine_id: str = None
     ) -> None:
@@ -61,16 +106,38 @@ class AdkOrchestratorAgentExecutor(AgentExecutor, ABC):
 
         Args:
             remote_agent_addresses: A list of remote agent addresses.
-            agent_engine_id: Optional agent engine ID for memory bank. If not
-              provided, creates a new one.
+            agent_engine_id: Optional agent engine ID for memory bank. Defaults to
+              the memory_bank_engine_env environment variable; if neither is
+              set, one is created on first use.
         """
         self.remote_agent_addresses = remote_agent_addresses
         self.agent = None
         self.runner = None
+        self._init_lock = asyncio.Lock()
+        self._sessions = SessionCache()
+        # Reuse an existing engine when configured; creating one is a slow RPC
+        if agent_engine_id is None and self.memory_bank_engine_env:
+            agent_engine_id = os.environ.get(self.memory_bank_engine_env) or None
         self.agent_engine_id = agent_engine_id
 
-        if self.agent_engine_id is None:
-            self.agent_engine_id = self.get_agent_engine()
+        # Read once and fail fast; both are needed for every Vertex AI call
+        self.project_id = os.environ.get("PROJECT_ID")
+        self.location = os.environ.get("LOCATION")
+        missing = [
+            name
+            for name, value in (
+                ("PROJECT_ID", self.project_id),
+                ("LOCATION", self.location),
+            )
+            if not value
+        ]
+        if missing:
+            raise ValueError(
+                f"Required environment variable(s) {', '.join(missing)} not set. "
+                "Please set them to the Google Cloud project and region."
+            )
+
+        self._warmup_task = self._schedule_warmup()
 
     @abstractmethod
     def get_agent_engine(self) -> str:
@@ -90,32 +157,28 @@ class AdkOrchestratorAgentExecutor(AgentExecutor, ABC):
         Lazy initialization of agent resources.
         This now constructs the agent and its serializable auth.
         """
-        if self.agent is None:
-            # --- Environment setup ---
-            httpx_client = httpx.AsyncClient(
-                timeout=120,
-                auth=GoogleAuth(),
-            )
-            httpx_client.headers["Content-Type"] = "application/json"
-            # Create the actual agent
-            self.agent = await get_orchestrator_agent(
-                remote_agent_addresses=self.remote_agent_addresses,
-                httpx_client=httpx_client,
-            )
+        if self.runner is None:
+            # Create the actual agent, or reuse one built for the same remotes
+            await self._prebuild_agent()
+
+            # Create the agent engine on first use rather than at construction,
+            # off the event loop since the Vertex AI SDK call blocks
+            if self.agent_engine_id is None:
+                self.agent_engine_id = await asyncio.to_thread(self.get_agent_engine)
 
             # Configure memory and session services
             if self.agent_engine_id:
                 # Use Vertex AI Memory Bank and Session Service for production
-                my_memory_service = PersistentVertexAiMemoryBankService(
-                    project=os.environ.get("PROJECT_ID"),
-                    location=os.environ.get("LOCATION"),
-                    agent_engine_id=self.agent_engine_id,
+                my_memory_service = get_memory_service(
+                    self.project_id,
+                    self.location,
+                    self.agent_engine_id,
                 )
 
-                my_session_service = VertexAiSessionService(
-                    project=os.environ.get("PROJECT_ID"),
-                    location=os.environ.get("LOCATION"),
-                    agent_engine_id=self.agent_engine_id,
+                my_session_service = get_session_service(
+                    self.project_id,
+                    self.location,
+                    self.agent_engine_id,
                 )
             else:
                 # Use in-memory services for local testing
@@ -127,11 +190,51 @@ class AdkOrchestratorAgentExecutor(AgentExecutor, ABC):
             self.runner = Runner(
                 app_name=self.agent.name,
                 agent=self.agent,
-                artifact_service=InMemoryArtifactService(),
+                artifact_service=BoundedArtifactService(),
                 session_service=my_session_service,
                 memory_service=my_memory_service,
             )
 
+    async def _ensure_initialized(self) -> None:
+        """Initialize the agent once, even with concurrent callers.
+
+        The lock keeps a request that arrives during warmup from building a
+        second runner.
+        """
+        async with self._init_lock:
+            if self.runner is None:
+                await self._init_agent()
+
+    async def _prebuild_agent(self) -> None:
+        """Build the orchestrator agent ahead of the first request.
+
+        Only the agent is built, which covers credential discovery and the
+        agent card fetches. The memory bank engine and Runner wait for the
+        first request, so an agent_engine_id assigned after construction
+        still skips engine creation.
+        """
+        if self.agent is None:
+            self.agent = await _get_shared_orchestrator_agent(
+                self.remote_agent_addresses, get_shared_client()
+            )
+
+    def _schedule_warmup(self) -> asyncio.Task | None:
+        """Start warmup in the background if constructed inside an event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop yet; the first request initializes the agent instead
+            return None
+        task = loop.create_task(self._prebuild_agent())
+        task.add_done_callback(self._log_warmup_failure)
+        return task
+
+    @staticmethod
+    def _log_warmup_failure(task: asyncio.Task) -> None:
+        """Log a failed warmup; the first request retries the init."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Agent warmup failed: %s", task.exception())
+
     async def execute(
         self,
         context: RequestContext,
@@ -143,13 +246,13 @@ class AdkOrchestratorAgentExecutor(AgentExecutor, ABC):
         1. A new message arrives (message/send)
         2. A streaming request is made (message/stream)
         """
-        # Initialize agent on first call
-        if self.agent is None:
-            await self._init_agent()
+        # Initialize agent resources on first call
+        if self.runner is None:
+            await self._ensure_initialized()
 
         # Extract the user's question from the protocol message
         query = context.get_user_input()
-        logging.info(f"Received query: {query}")
+        logger.info("Received query: %s", query)
 
         # Create a TaskUpdater for managing task state
         updater = TaskUpdater(event_queue, context.task_id, context.context_id)
@@ -166,10 +269,13 @@ class AdkOrchestratorAgentExecutor(AgentExecutor, ABC):
         try:
             # Get or create a session for this conversation
             session = await self._get_or_create_session(context.context_id)
-            logging.info(f"Using session: {session.id}")
+            logger.info("Using session: %s", session.id)
 
             # Prepare the user message in ADK format
-            content = types.Content(role=Role.user, parts=[types.Part(text=query)])
+            # Fields are already valid, so skip pydantic validation
+            content = types.Content.model_construct(
+                role=_USER_ROLE, parts=[types.Part.model_construct(text=query)]
+            )
 
             # Run the agent asynchronously
             # This may involve multiple LLM calls and tool uses
@@ -184,7 +290,7 @@ class AdkOrchestratorAgentExecutor(AgentExecutor, ABC):
                 if event.is_final_response() and not answer_sent:
                     # Extract the answer text from the response
                     answer = self._extract_answer(event)
-                    logging.info(f" {answer}")
+                    logger.info(" %s", answer)
 
                     # Add the answer as an artifact
                     # Artifacts are the "outputs" or "results" of a task
@@ -202,7 +308,7 @@ class AdkOrchestratorAgentExecutor(AgentExecutor, ABC):
         except Exception as e:
             # Errors should never pass silently (Zen of Python)
             # Always inform the client when something goes wrong
-            logging.error(f"Error during execution: {e!s}", exc_info=True)
+            logger.error("Error during execution: %s", e, exc_info=True)
             await updater.update_status(
                 TaskState.failed, message=new_agent_text_message(f"Error: {e!s}")
             )
@@ -216,43 +322,51 @@ class AdkOrchestratorAgentExecutor(AgentExecutor, ABC):
         because the A2A context_id format may not be compatible with Vertex AI's
         session resource name requirements. The session service will generate
         a valid session ID.
+
+        Either way the session is cached per context and reused for
+        follow-up turns until it expires, skipping the session service call.
         """
-        if isinstance(self.runner.session_service, InMemorySessionService):
-            # For in-memory sessions, we can use the context_id directly
-            session = await self.runner.session_service.get_session(
-                app_name=self.runner.app_name,
-                user_id="user",
-                session_id=context_id,
-            )
 
-            if not session:
-                logging.info(f"No session found for {context_id}, creating new one.")
-                session = await self.runner.session_service.create_session(
+        async def create() -> Session:
+            if isinstance(self.runner.session_service, InMemorySessionService):
+                # For in-memory sessions, we can use the context_id directly.
+                session = await self.runner.session_service.get_session(
                     app_name=self.runner.app_name,
                     user_id="user",
                     session_id=context_id,
                 )
-            else:
-                logging.info(f"Found existing session {context_id}.")
-        else:
-            # For Vertex AI Session Service, create a new session without passing session_id
-            # Let Vertex AI generate a valid session resource name
-            logging.info(f"Creating new session for context {context_id}.")
-            session = await self.runner.session_service.create_session(
+
+                if not session:
+                    logger.info(
+                        "No session found for %s, creating new one.", context_id
+                    )
+                    session = await self.runner.session_service.create_session(
+                        app_name=self.runner.app_name,
+                        user_id="user",
+                        session_id=context_id,
+                    )
+                else:
+                    logger.info("Found existing session %s.", context_id)
+                return session
+
+            # For Vertex AI Session Service, create a new session without
+            # passing session_id; let Vertex AI generate a valid resource name
+            logger.info("Creating new session for context %s.", context_id)
+            return await self.runner.session_service.create_session(
                 app_name=self.runner.app_name,
                 user_id="user",
                 # Don't pass session_id - let Vertex AI generate a valid one
             )
 
-        return session
+        return await self._sessions.get_or_create(context_id, create)
 
     def _extract_answer(self, event) -> str:
         """Extract text answer from agent response."""
         parts = event.content.parts
-        text_parts = [part.text for part in parts if part.text]
 
         # Join all text parts with space
-        return " ".join(text_parts) if text_parts else "No answer found."
+        answer = " ".join(filter(None, (part.text for part in parts)))
+        return answer or "No answer found."
 
     async def cancel(
         self, context: RequestContext, event_queue: EventQueue
@@ -264,8 +378,8 @@ class AdkOrchestratorAgentExecutor(AgentExecutor, ABC):
         2. Clean up resources
         3. Update task state to 'cancelled'
         """
-        logging.warning(
-            f"Cancellation requested for task {context.task_id}, but not supported."
+        logger.warning(
+            "Cancellation requested for task %s, but not supported.", context.task_id
         )
         # Inform client that cancellation isn't supported
         raise ServerError(error=UnsupportedOperationError())
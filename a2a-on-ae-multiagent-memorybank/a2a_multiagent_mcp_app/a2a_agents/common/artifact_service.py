@@ -0,0 +1,56 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Bounded in-memory artifact storage for long-running executors."""
+
+from google.adk.artifacts import InMemoryArtifactService
+
+DEFAULT_MAX_ARTIFACTS = 1024
+
+
+class BoundedArtifactService(InMemoryArtifactService):
+    """An InMemoryArtifactService that keeps at most ``maxsize`` artifacts.
+
+    The stock service keeps every artifact of every session for the life of
+    the process. This one evicts the least recently saved artifact (with all
+    its versions) once the limit is reached, so memory stays flat on
+    long-lived engines.
+
+    Example:
+        >>> runner = Runner(..., artifact_service=BoundedArtifactService())
+    """
+
+    maxsize: int = DEFAULT_MAX_ARTIFACTS
+
+    async def save_artifact(self, **kwargs) -> int:
+        """Saves an artifact, then evicts the stalest ones beyond ``maxsize``.
+
+        Args:
+            **kwargs: Forwarded to InMemoryArtifactService.save_artifact.
+
+        Returns:
+            The version number of the saved artifact.
+        """
+        version = await super().save_artifact(**kwargs)
+        # Move the artifact just written to the end, so the first key is
+        # always the least recently saved one
+        path = self._artifact_path(
+            app_name=kwargs["app_name"],
+            user_id=kwargs["user_id"],
+            filename=kwargs["filename"],
+            session_id=kwargs.get("session_id"),
+        )
+        self.artifacts[path] = self.artifacts.pop(path)
+        while len(self.artifacts) > self.maxsize:
+            del self.artifacts[next(iter(self.artifacts))]
+        return version
@@ -13,7 +13,11 @@
 # limitations under the License.
 """Shared authentication utilities for Google Cloud services."""
 
+import datetime
+import functools
 import logging
+import threading
+import time
 from typing import Generator
 
 import httpx
@@ -23,6 +27,19 @@ from google.auth.transport.requests import Request as AuthRequest
 
 logger = logging.getLogger(__name__)
 
+# Rebuild the cached header this long before the token actually expires
+_HEADER_EXPIRY_SKEW_SECONDS = 60
+
+
+@functools.lru_cache(maxsize=1)
+def _default_credentials() -> tuple[Credentials, str | None]:
+    """Resolves Application Default Credentials once per process.
+
+    Returns:
+        The (credentials, project) tuple from google.auth.default.
+    """
+    return default(scopes=["https://www.googleapis.com/auth/cloud-platform"])
+
 
 class GoogleAuth(httpx.Auth):
     """A custom httpx Auth class for Google Cloud authentication.
@@ -38,6 +55,11 @@ class GoogleAuth(httpx.Auth):
         >>> response = await client.get("https://example.googleapis.com/api")
     """
 
+    # Shared by all instances: the credentials object is shared too, so one
+    # refresh serves every client
+    _auth_request = AuthRequest()
+    _refresh_lock = threading.Lock()
+
     def __init__(self) -> None:
         """Initializes the GoogleAuth instance with default credentials.
 
@@ -46,13 +68,17 @@ class GoogleAuth(httpx.Auth):
         - Service account credentials in production
         - User credentials from gcloud auth in development
         - Metadata server credentials in GCP environments
+
+        Credentials are resolved once per process and shared by all instances.
         """
         self.credentials: Credentials
         self.project: str | None
-        self.credentials, self.project = default(
-            scopes=["https://www.googleapis.com/auth/cloud-platform"]
-        )
-        self.auth_request = AuthRequest()
+        self.credentials, self.project = _default_credentials()
+        self.auth_request = self._auth_request
+        # Authorization header for the current token and the monotonic time
+        # until which it can be reused without looking at the credentials
+        self._header: str | None = None
+        self._header_deadline = 0.0
 
     def auth_flow(
         self, request: httpx.Request
@@ -63,17 +89,48 @@ class GoogleAuth(httpx.Auth):
         1. The credentials are valid and refreshes them if expired
         2. The Authorization header is added with the current token
 
+        The header is cached until shortly before the token expires, so most
+        requests skip the credential check and string formatting.
+
         Args:
             request: The httpx request to add the header to.
 
         Yields:
             The request with the Authorization header added.
         """
+        if self._header is not None and time.monotonic() < self._header_deadline:
+            request.headers["Authorization"] = self._header
+            yield request
+            return
+
         # Refresh the credentials if they are expired
         if not self.credentials.valid:
-            logger.info("Credentials expired, refreshing...")
-            self.credentials.refresh(self.auth_request)
+            with self._refresh_lock:
+                # Another request may have refreshed while we waited
+                if not self.credentials.valid:
+                    logger.info("Credentials expired, refreshing...")
+                    self.credentials.refresh(self.auth_request)
 
         # Add the Authorization header to the request
-        request.headers["Authorization"] = f"Bearer {self.credentials.token}"
+        self._header = f"Bearer {self.credentials.token}"
+        self._header_deadline = self._monotonic_deadline(self.credentials.expiry)
+        request.headers["Authorization"] = self._header
         yield request
+
+    @staticmethod
+    def _monotonic_deadline(expiry: datetime.datetime | None) -> float:
+        """Converts a token expiry into a deadline on the monotonic clock.
+
+        Args:
+            expiry: The credentials' expiry as a naive UTC datetime, if any.
+
+        Returns:
+            The time.monotonic() value until which the header can be reused;
+            0.0 when the expiry is unknown so the credentials are checked on
+            every request, as before.
+        """
+        if expiry is None:
+            return 0.0
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        remaining = (expiry - now).total_seconds() - _HEADER_EXPIRY_SKEW_SECONDS
+        return time.monotonic() + remaining
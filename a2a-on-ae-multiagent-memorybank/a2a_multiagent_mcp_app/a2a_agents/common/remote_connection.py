@@ -13,7 +13,7 @@
 # limitations under the License.
 # Author: Dave Wang
 import logging
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 
 from a2a.client import Client, ClientFactory
 from a2a.types import (
@@ -31,10 +31,25 @@ logger = logging.getLogger(__name__)
 TaskCallbackArg = Task | TaskStatusUpdateEvent | TaskArtifactUpdateEvent
 TaskUpdateCallback = Callable[[TaskCallbackArg, AgentCard], Task]
 
+# Task states that end the remote agent's task
+TERMINAL_STATES = frozenset(
+    {
+        TaskState.completed,
+        TaskState.canceled,
+        TaskState.failed,
+        TaskState.unknown,
+    }
+)
+
+# Task states after which the remote agent's stream has nothing more to add
+_TERMINAL_OR_INTERRUPTED_STATES = TERMINAL_STATES | {TaskState.input_required}
+
 
 class RemoteAgentConnections:
     """A class to hold the connections to the remote agents."""
 
+    __slots__ = ("agent_client", "card", "name")
+
     def __init__(self, client_factory: ClientFactory, agent_card: AgentCard):
         """Initializes the RemoteAgentConnections.
 
@@ -44,7 +59,7 @@ class RemoteAgentConnections:
         """
         self.agent_client: Client = client_factory.create(agent_card)
         self.card: AgentCard = agent_card
-        self.pending_tasks = set()
+        self.name: str = agent_card.name
 
     def get_agent(self) -> AgentCard:
         """Gets the agent card.
@@ -54,6 +69,35 @@ class RemoteAgentConnections:
         """
         return self.card
 
+    async def stream_message(self, message: Message) -> AsyncIterator[Task | Message]:
+        """Sends a message and yields the remote agent's updates as they arrive.
+
+        The stream ends after a Message or a terminal or interrupted task, so
+        callers can surface progress without waiting for the final result.
+
+        Args:
+            message: The message to send.
+
+        Yields:
+            Each task update, or the single Message the agent replied with.
+        """
+        try:
+            logger.info("Sending message to remote agent: %s", self.name)
+            logger.debug("Message content: %s", message)
+            async for event in self.agent_client.send_message(message):
+                if isinstance(event, Message):
+                    logger.info("Received message object from remote agent")
+                    logger.debug("Message content: %s", event)
+                    yield event
+                    return
+                task = event[0]
+                yield task
+                if self.is_terminal_or_interrupted(task):
+                    return
+        except Exception:
+            logger.exception("Exception in send_message to %s", self.name)
+            raise
+
     async def send_message(self, message: Message) -> Task | Message | None:
         """Sends a message to the remote agent.
 
@@ -66,26 +110,13 @@ class RemoteAgentConnections:
         Raises:
             Exception: If an error occurs during message sending.
         """
-        lastTask: Task | None = None
-        try:
-            logger.info(f"Sending message to remote agent: {self.card.name}")
-            logger.debug(f"Message content: {message}")
-            async for event in self.agent_client.send_message(message):
-                if isinstance(event, Message):
-                    logger.info("Received message object from remote agent")
-                    logger.debug(f"Message content: {event}")
-                    return event
-                if self.is_terminal_or_interrupted(event[0]):
-                    return event[0]
-                lastTask = event[0]
-        except Exception as e:
-            logger.error(
-                f"Exception in send_message to {self.card.name}: {e}", exc_info=True
-            )
-            raise
-        return lastTask
+        last: Task | Message | None = None
+        async for event in self.stream_message(message):
+            last = event
+        return last
 
-    def is_terminal_or_interrupted(self, task: Task) -> bool:
+    @staticmethod
+    def is_terminal_or_interrupted(task: Task) -> bool:
         """Checks if the task is terminal or interrupted.
 
         Args:
@@ -94,10 +125,4 @@ class RemoteAgentConnections:
         Returns:
             True if the task is terminal or interrupted, False otherwise.
         """
-        return task.status.state in [
-            TaskState.completed,
-            TaskState.canceled,
-            TaskState.failed,
-            TaskState.input_required,
-            TaskState.unknown,
-        ]
+        return task.status.state in _TERMINAL_OR_INTERRUPTED_STATES
@@ -0,0 +1,106 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Per-executor cache of ADK sessions keyed by A2A context ID."""
+
+import asyncio
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from google.adk.sessions import Session
+
+logger = logging.getLogger(__name__)
+
+# Bounds for the context_id -> session cache
+SESSION_CACHE_SIZE = 1024
+SESSION_TTL_SECONDS = 3600
+
+
+class SessionCache:
+    """A bounded, expiring context_id -> session cache.
+
+    Follow-up turns in a conversation reuse the session resolved for the
+    first turn instead of calling the session service again. Misses are
+    serialized per context, so concurrent first turns create one session
+    without blocking lookups for other contexts.
+
+    Example:
+        >>> session = await self._sessions.get_or_create(context_id, create)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = SESSION_CACHE_SIZE,
+        ttl_seconds: float = SESSION_TTL_SECONDS,
+    ) -> None:
+        """Initializes the SessionCache.
+
+        Args:
+            maxsize: Most sessions kept; the least recently used is evicted.
+            ttl_seconds: How long a cached session is reused.
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._sessions: OrderedDict[str, tuple[Session, float]] = OrderedDict()
+        # Dropped automatically once no coroutine holds or waits on them
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+    async def get_or_create(
+        self, context_id: str, create: Callable[[], Awaitable[Session]]
+    ) -> Session:
+        """Returns the cached session for a context, creating it on a miss.
+
+        Args:
+            context_id: The A2A context ID of the conversation.
+            create: Resolves the session when none is cached.
+
+        Returns:
+            The session for this context.
+        """
+        session = self._get(context_id)
+        if session is not None:
+            return session
+
+        async with self._lock(context_id):
+            session = self._get(context_id)
+            if session is not None:
+                return session
+
+            session = await create()
+            self._sessions[context_id] = (session, time.monotonic() + self.ttl_seconds)
+            self._sessions.move_to_end(context_id)
+            while len(self._sessions) > self.maxsize:
+                self._sessions.popitem(last=False)
+        return session
+
+    def _get(self, context_id: str) -> Session | None:
+        """Returns the unexpired cached session for a context, if any."""
+        cached = self._sessions.get(context_id)
+        if cached is None or cached[1] <= time.monotonic():
+            return None
+        self._sessions.move_to_end(context_id)
+        logger.info("Reusing session %s for context %s.", cached[0].id, context_id)
+        return cached[0]
+
+    def _lock(self, context_id: str) -> asyncio.Lock:
+        """Returns the lock guarding session creation for a context."""
+        lock = self._locks.get(context_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[context_id] = lock
+        return lock
@@ -12,14 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # Author: Dave Wang
+from common.adk_base_mcp_agent_executor import get_or_create_memory_bank_engine
 from common.adk_orchestrator_agent_executor import AdkOrchestratorAgentExecutor
-import logging
 import os
-from dotenv import load_dotenv
 
-# Set logging
-logging.getLogger().setLevel(logging.INFO)
-load_dotenv()
+# Remote agent addresses, resolved once at import; common has already loaded .env
+REMOTE_AGENT_ADDRESSES: tuple[str, ...] = (
+    os.getenv("CT_AGENT_URL", "http://localhost:10002"),
+    os.getenv("WEA_AGENT_URL", "http://localhost:10001"),
+)
 
 
 class HostingAgentExecutor(AdkOrchestratorAgentExecutor):
@@ -30,19 +31,18 @@ class HostingAgentExecutor(AdkOrchestratorAgentExecutor):
     from environment variables and delegating to OrchestratorAgentExecutor.
     """
 
+    memory_bank_engine_env = "HOSTING_MEMORY_ENGINE_ID"
+
     def __init__(self, agent_engine_id: str = None) -> None:
         """Initialize with remote agent addresses from environment variables.
 
         Args:
-            agent_engine_id: Optional agent engine ID for memory bank. If not
-              provided, creates a new one.
+            agent_engine_id: Optional agent engine ID for memory bank. Defaults to
+              the HOSTING_MEMORY_ENGINE_ID environment variable; if neither is
+              set, one is created on first use.
         """
-        remote_agent_addresses = [
-            os.getenv("CT_AGENT_URL", "http://localhost:10002"),
-            os.getenv("WEA_AGENT_URL", "http://localhost:10001"),
-        ]
         super().__init__(
-            remote_agent_addresses=remote_agent_addresses,
+            remote_agent_addresses=list(REMOTE_AGENT_ADDRESSES),
             agent_engine_id=agent_engine_id,
         )
 
@@ -61,16 +61,6 @@ class HostingAgentExecutor(AdkOrchestratorAgentExecutor):
         Returns:
             str: Agent engine ID
         """
-        import vertexai
-
-        project_id = os.environ.get("PROJECT_ID")
-        location = os.environ.get("LOCATION")
-
-        client = vertexai.Client(
-            project=project_id,
-            location=location,
-        )
-
         orchestrator_memory_config = {
             # "generate_memories_examples": [example],
             "memory_topics": [
@@ -131,17 +121,6 @@ class HostingAgentExecutor(AdkOrchestratorAgentExecutor):
             ],
         }
 
-        agent_engine = client.agent_engines.create(
-            config={
-                "context_spec": {
-                    "memory_bank_config": {
-                        "generation_config": {
-                            "model": f"projects/{project_id}/locations/{location}/publishers/google/models/gemini-2.5-flash"
-                        },
-                        "customization_configs": [orchestrator_memory_config],
-                    }
-                }
-            }
+        return get_or_create_memory_bank_engine(
+            self.project_id, self.location, [orchestrator_memory_config]
         )
-        agent_engine_id = agent_engine.api_resource.name.split("/")[-1]
-        return agent_engine_id
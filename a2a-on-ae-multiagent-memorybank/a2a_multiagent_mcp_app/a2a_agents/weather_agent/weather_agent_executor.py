@@ -13,22 +13,21 @@
 # limitations under the License.
 # Author: Dave Wang
 
-import logging
-from typing import Dict
-from dotenv import load_dotenv
+from typing import Mapping
 
 from common.agent_configs import WEATHER_AGENT_CONFIG
-from common.adk_base_mcp_agent_executor import AdkBaseMcpAgentExecutor
-
-# Set logging
-logging.getLogger().setLevel(logging.INFO)
-load_dotenv()
+from common.adk_base_mcp_agent_executor import (
+    AdkBaseMcpAgentExecutor,
+    get_or_create_memory_bank_engine,
+)
 
 
 class WeatherAgentExecutor(AdkBaseMcpAgentExecutor):
     """Agent Executor for weather-related queries using MCP tools."""
 
-    def get_agent_config(self) -> Dict:
+    memory_bank_engine_env = "WEATHER_MEMORY_ENGINE_ID"
+
+    def get_agent_config(self) -> Mapping[str, str]:
         """Return weather agent configuration."""
         return WEATHER_AGENT_CONFIG
 
@@ -46,13 +45,6 @@ class WeatherAgentExecutor(AdkBaseMcpAgentExecutor):
         Returns:
             str: Agent engine ID
         """
-        import vertexai
-
-        client = vertexai.Client(
-            project=self.project_id,
-            location=self.location,
-        )
-
         user_preferences_config = {
             # "generate_memories_examples": [example],
             "memory_topics": [
@@ -83,20 +75,6 @@ class WeatherAgentExecutor(AdkBaseMcpAgentExecutor):
             ],
         }
 
-        agent_engine = client.agent_engines.create(
-            config={
-                "context_spec": {
-                    "memory_bank_config": {
-                        "generation_config": {
-                            "model": (
-                                f"projects/{self.project_id}/locations/{self.location}/"
-                                "publishers/google/models/gemini-2.5-flash"
-                            )
-                        },
-                        "customization_configs": [user_preferences_config],
-                    }
-                }
-            }
+        return get_or_create_memory_bank_engine(
+            self.project_id, self.location, [user_preferences_config]
         )
-        agent_engine_id = agent_engine.api_resource.name.split("/")[-1]
-        return agent_engine_id
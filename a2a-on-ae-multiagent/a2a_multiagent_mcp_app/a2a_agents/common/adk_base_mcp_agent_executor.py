@@ -13,10 +13,12 @@
 # limitations under the License.
 # Author: Dave Wang
 import logging
+import os
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, NoReturn
+from typing import Dict, Mapping, NoReturn
 
+import requests
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.server.tasks import TaskUpdater
@@ -25,9 +27,8 @@ from a2a.utils import new_agent_text_message
 from a2a.utils.errors import ServerError
 from google.adk import Runner
 from google.adk.agents import LlmAgent
-from google.adk.artifacts import InMemoryArtifactService
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
-from google.adk.sessions import InMemorySessionService
+from google.adk.sessions import InMemorySessionService, Session
 from google.adk.tools.mcp_tool.mcp_toolset import (
     McpToolset,
     StreamableHTTPConnectionParams,
@@ -36,6 +37,28 @@ from google.auth import exceptions as google_auth_exceptions
 from google.auth.transport import requests as google_auth_requests
 from google.genai import types
 from google.oauth2 import id_token as google_id_token
+from requests.adapters import HTTPAdapter
+
+from common.artifact_service import BoundedArtifactService
+from common.session_cache import SessionCache
+
+logger = logging.getLogger(__name__)
+
+# Plain string rather than the enum: model_construct skips pydantic's coercion
+_USER_ROLE = Role.user.value
+
+
+def _create_auth_request() -> google_auth_requests.Request:
+    """Create a google-auth transport backed by a pooled, keep-alive session."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return google_auth_requests.Request(session=session)
+
+
+# Shared transport for OIDC token fetches so refreshes reuse open connections.
+_AUTH_REQUEST = _create_auth_request()
 
 
 def get_gcp_auth_headers(audience: str) -> Dict[str, str]:
@@ -51,22 +74,29 @@ def get_gcp_auth_headers(audience: str) -> Dict[str, str]:
         audience: The full URL/URI of the target service (e.g., your Cloud Run URL),
                   which is used as the audience for the OIDC token.
 
+    Set SKIP_GCP_AUTH=1 for local development against an unauthenticated
+    server; this returns immediately instead of probing for credentials,
+    which can wait on metadata server timeouts when there are none.
+
     Returns:
         A dictionary with the "Authorization" header, or an empty
         dictionary if auth fails or is skipped (e.g., no credentials).
     """
+    if os.getenv("SKIP_GCP_AUTH", "").lower() in ("1", "true"):
+        logger.info("SKIP_GCP_AUTH is set; skipping OIDC token fetch.")
+        return {}
+
     try:
         # This single call is the canonical way to get an OIDC token using ADC.
         # It automatically finds credentials (local, SA, or metadata server).
-        auth_req = google_auth_requests.Request()
-        token = google_id_token.fetch_id_token(auth_req, audience)
+        token = google_id_token.fetch_id_token(_AUTH_REQUEST, audience)
 
-        logging.info("Successfully fetched OIDC token via google.auth.")
+        logger.info("Successfully fetched OIDC token via google.auth.")
         return {"Authorization": f"Bearer {token}"}
 
     except google_auth_exceptions.DefaultCredentialsError:
         # This is expected in local environments without ADC setup.
-        logging.warning(
+        logger.warning(
             "No Google Cloud credentials found (DefaultCredentialsError). "
             "Skipping OIDC token fetch. This is normal for local dev."
         )
@@ -74,8 +104,10 @@ def get_gcp_auth_headers(audience: str) -> Dict[str, str]:
     except Exception as e:
         # Any other error means ADC was likely found but token minting failed
         # (e.g., IAM permissions, wrong audience, metadata server unreachable).
-        logging.critical(
-            f"An unexpected error occurred fetching OIDC token for audience '{audience}': {e}",
+        logger.critical(
+            "An unexpected error occurred fetching OIDC token for audience '%s': %s",
+            audience,
+            e,
             exc_info=True,
         )
 
@@ -119,7 +151,9 @@ class TokenManager:
                 # ID tokens typically expire in 1 hour (3600 seconds)
                 # Refresh 5 minutes (300 seconds) before expiry by default
                 self._expiry = current_time + 3600 - self.refresh_buffer_seconds
-                logging.info(f"TokenManager: Refreshed token, next refresh at {self._expiry}")
+                logger.info(
+                    "TokenManager: Refreshed token, next refresh at %s", self._expiry
+                )
             else:
                 # No token available
                 self._token = None
@@ -145,14 +179,16 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
         self.agent = None
         self.runner = None
         self.token_manager = None
+        self._sessions = SessionCache()
 
     @abstractmethod
-    def get_agent_config(self) -> Dict:
+    def get_agent_config(self) -> Mapping[str, str]:
         """
-        Return agent configuration dictionary.
+        Return agent configuration mapping.
 
         Returns:
-            Dict with keys: name, description, instruction, model, mcp_url_env_var
+            Read-only mapping with keys: name, description, instruction, model,
+            mcp_url_env_var
         """
         pass
 
@@ -205,7 +241,7 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
                 agent=self.agent,
                 # In-memory services for simplicity
                 # In production, you might use persistent storage
-                artifact_service=InMemoryArtifactService(),
+                artifact_service=BoundedArtifactService(),
                 session_service=InMemorySessionService(),
                 memory_service=InMemoryMemoryService(),
             )
@@ -227,7 +263,7 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
 
         # Extract the user's question from the protocol message
         query = context.get_user_input()
-        logging.info(f"Received query: {query}")
+        logger.info("Received query: %s", query)
 
         # Create a TaskUpdater for managing task state
         updater = TaskUpdater(event_queue, context.task_id, context.context_id)
@@ -247,10 +283,13 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
         try:
             # Get or create a session for this conversation
             session = await self._get_or_create_session(context.context_id)
-            logging.info(f"Using session: {session.id}")
+            logger.info("Using session: %s", session.id)
 
             # Prepare the user message in ADK format
-            content = types.Content(role=Role.user, parts=[types.Part(text=query)])
+            # Fields are already valid, so skip pydantic validation
+            content = types.Content.model_construct(
+                role=_USER_ROLE, parts=[types.Part.model_construct(text=query)]
+            )
 
             # Run the agent asynchronously
             # This may involve multiple LLM calls and tool uses
@@ -264,7 +303,7 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
                 if event.is_final_response():
                     # Extract the answer text from the response
                     answer = self._extract_answer(event)
-                    logging.info(f" {answer}")
+                    logger.info(" %s", answer)
 
                     # Add the answer as an artifact
                     # Artifacts are the "outputs" or "results" of a task
@@ -281,7 +320,7 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
         except Exception as e:
             # Errors should never pass silently (Zen of Python)
             # Always inform the client when something goes wrong
-            logging.error(f"Error during execution: {e!s}", exc_info=True)
+            logger.error("Error during execution: %s", e, exc_info=True)
             await updater.update_status(
                 TaskState.failed, message=new_agent_text_message(f"Error: {e!s}")
             )
@@ -291,7 +330,7 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
     def _refresh_mcp_auth(self) -> None:
         """Refresh MCP authentication headers using the token manager."""
         if self.token_manager is None:
-            logging.warning("TokenManager not initialized, skipping auth refresh")
+            logger.warning("TokenManager not initialized, skipping auth refresh")
             return
 
         # Get fresh headers from token manager (will auto-refresh if expired)
@@ -303,35 +342,43 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
                 # Access private attribute to update headers
                 if hasattr(tool._connection_params, "headers"):
                     tool._connection_params.headers = fresh_headers
-                    logging.debug("Refreshed MCP authentication headers")
+                    logger.debug("Refreshed MCP authentication headers")
 
     async def _get_or_create_session(self, context_id: str):
-        """Get existing session or create new one."""
-        session = await self.runner.session_service.get_session(
-            app_name=self.runner.app_name,
-            user_id="user",
-            session_id=context_id,
-        )
+        """Get existing session or create new one.
+
+        Sessions are cached per context, so follow-up turns skip the
+        session service lookup. The runner reloads the session by ID on every
+        run, so a cached object never serves stale events.
+        """
 
-        if not session:
-            logging.info(f"No session found for {context_id}, creating new one.")
-            session = await self.runner.session_service.create_session(
+        async def create() -> Session:
+            session = await self.runner.session_service.get_session(
                 app_name=self.runner.app_name,
                 user_id="user",
                 session_id=context_id,
             )
-        else:
-            logging.info(f"Found existing session {context_id}.")
 
-        return session
+            if not session:
+                logger.info("No session found for %s, creating new one.", context_id)
+                session = await self.runner.session_service.create_session(
+                    app_name=self.runner.app_name,
+                    user_id="user",
+                    session_id=context_id,
+                )
+            else:
+                logger.info("Found existing session %s.", context_id)
+            return session
+
+        return await self._sessions.get_or_create(context_id, create)
 
     def _extract_answer(self, event) -> str:
         """Extract text answer from agent response."""
         parts = event.content.parts
-        text_parts = [part.text for part in parts if part.text]
 
         # Join all text parts with space
-        return " ".join(text_parts) if text_parts else "No answer found."
+        answer = " ".join(filter(None, (part.text for part in parts)))
+        return answer or "No answer found."
 
     async def cancel(self, context: RequestContext, event_queue: EventQueue) -> NoReturn:
         """Handle task cancellation requests.
@@ -341,6 +388,8 @@ class AdkBaseMcpAgentExecutor(AgentExecutor, ABC):
         2. Clean up resources
         3. Update task state to 'cancelled'
         """
-        logging.warning(f"Cancellation requested for task {context.task_id}, but not supported.")
+        logger.warning(
+            "Cancellation requested for task %s, but not supported.", context.task_id
+        )
         # Inform client that cancellation isn't supported
         raise ServerError(error=UnsupportedOperationError())
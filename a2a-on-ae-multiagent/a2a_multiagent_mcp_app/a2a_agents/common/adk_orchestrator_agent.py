@@ -32,7 +32,7 @@ from a2a.types import (
     TransportProtocol,
 )
 from common.remote_connection import RemoteAgentConnections, TaskUpdateCallback
-from dotenv import load_dotenv
+from common.single_flight import SingleFlight
 from google.adk import Agent
 from google.adk.agents.callback_context import CallbackContext
 from google.adk.agents.readonly_context import ReadonlyContext
@@ -43,8 +43,6 @@ from google.genai import types
 
 logger = logging.getLogger(__name__)
 
-load_dotenv()
-
 
 class AdkOrchestratorAgent:
     """The orchestrator agent.
@@ -80,6 +78,8 @@ class AdkOrchestratorAgent:
         self.remote_agent_connections: dict[str, RemoteAgentConnections] = {}
         self.cards: dict[str, AgentCard] = {}
         self.agents: str = ""
+        # In-flight remote sends keyed by (invocation id, agent name, text)
+        self._single_flight = SingleFlight()
         loop = asyncio.get_running_loop()
         loop.create_task(self.init_remote_agent_addresses(remote_agent_addresses))
 
@@ -107,7 +107,7 @@ class AdkOrchestratorAgent:
         )
         card = await card_resolver.get_agent_card()
 
-        logger.info(f"Retrieved card for {card.name} from {address}")
+        logger.info("Retrieved card for %s from %s", card.name, address)
         self.register_agent_card(card)
 
     def register_agent_card(self, card: AgentCard):
@@ -152,6 +152,8 @@ can use to delegate the task.
 
 Execution:
 - For actionable requests, you can use `send_message` to interact with remote agents to take action.
+- When a request needs more than one remote agent, call `send_message` for each of
+them in the same turn so the calls run in parallel.
 
 Be sure to include the remote agent name when you respond to the user.
 
@@ -242,10 +244,38 @@ Current agent: {current_agent["active_agent"]} """
             context_id=context_id,
             task_id=task_id,
         )
-        response = await client.send_message(request_message)
+
+        async def send_and_convert() -> list:
+            response = await client.send_message(request_message)
+            return await self._convert_response(agent_name, response, tool_context)
+
+        # Identical calls are only shared within one invocation, never across
+        # users or turns. Joiners get the converted result, so file parts are
+        # saved as artifacts only once.
+        return await self._single_flight.run(
+            (tool_context.invocation_id, agent_name, message), send_and_convert
+        )
+
+    async def _convert_response(
+        self,
+        agent_name: str,
+        response: Task | Message | None,
+        tool_context: ToolContext,
+    ) -> list:
+        """Records a remote agent's reply in the session state and converts it.
+
+        Args:
+          agent_name: The name of the agent that replied.
+          response: The task or message the agent replied with.
+          tool_context: The tool context of the send.
+
+        Returns:
+          The converted parts of the reply.
+        """
+        state = tool_context.state
         if isinstance(response, Message):
             logger.info("Got message object from remote agent")
-            logger.debug(f"Message content: {response}")
+            logger.debug("Message content: %s", response)
             return await convert_parts(response.parts, tool_context)
         task: Task = response
         # Assume completion unless a state returns that isn't complete
@@ -12,14 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # Author: Dave Wang
+import asyncio
 import logging
 from typing import NoReturn
 import httpx
-from dotenv import load_dotenv
 from google.adk import Runner
-from google.adk.artifacts import InMemoryArtifactService
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
-from google.adk.sessions import InMemorySessionService
+from google.adk.sessions import InMemorySessionService, Session
 
 from google.genai import types
 
@@ -36,12 +35,52 @@ from a2a.types import (
 from a2a.utils import new_agent_text_message
 from a2a.utils.errors import ServerError
 
+from common.artifact_service import BoundedArtifactService
+from common.session_cache import SessionCache
 from common.adk_orchestrator_agent import get_orchestrator_agent
-from common.auth_utils import GoogleAuth
+from common.http_client import get_shared_client
 
-# Set logging
-logging.getLogger().setLevel(logging.INFO)
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Plain string rather than the enum: model_construct skips pydantic's coercion
+_USER_ROLE = Role.user.value
+
+# Orchestrator agents keyed by remote address set. Tasks rather than agents
+# are stored so concurrent cold starts share a single build. Like the shared
+# httpx client the agents send through, they assume the server runs a single
+# event loop for the life of the process.
+_ORCHESTRATOR_AGENTS: dict[frozenset[str], asyncio.Task] = {}
+
+
+async def _get_shared_orchestrator_agent(
+    remote_agent_addresses: list[str], httpx_client: httpx.AsyncClient
+):
+    """Returns the orchestrator agent for these remote agents, building it once.
+
+    Args:
+        remote_agent_addresses: A list of remote agent addresses.
+        httpx_client: The httpx client used to reach the remote agents.
+
+    Returns:
+        The orchestrator agent shared by executors with the same addresses.
+    """
+    key = frozenset(remote_agent_addresses)
+    task = _ORCHESTRATOR_AGENTS.get(key)
+    if task is None:
+        task = asyncio.create_task(
+            get_orchestrator_agent(
+                remote_agent_addresses=remote_agent_addresses,
+                httpx_client=httpx_client,
+            )
+        )
+        _ORCHESTRATOR_AGENTS[key] = task
+    try:
+        return await asyncio.shield(task)
+    except Exception:
+        # Let the next executor retry instead of caching the failure
+        if _ORCHESTRATOR_AGENTS.get(key) is task:
+            del _ORCHESTRATOR_AGENTS[key]
+        raise
 
 
 class AdkOrchestratorAgentExecutor(AgentExecutor):
@@ -63,22 +102,21 @@ class AdkOrchestratorAgentExecutor(AgentExecutor):
         self.remote_agent_addresses = remote_agent_addresses
         self.agent = None
         self.runner = None
+        self._init_lock = asyncio.Lock()
+        self._sessions = SessionCache()
+        self._warmup_task = self._schedule_warmup()
 
     async def _init_agent(self) -> None:
         """
         Lazy initialization of agent resources.
         This now constructs the agent and its serializable auth.
         """
-        if self.agent is None:
+        if self.runner is None:
             # --- Environment setup ---
-            httpx_client = httpx.AsyncClient(
-                timeout=120,
-                auth=GoogleAuth(),
-            )
-            httpx_client.headers["Content-Type"] = "application/json"
-            # Create the actual agent
-            self.agent = await get_orchestrator_agent(
-                remote_agent_addresses=self.remote_agent_addresses, httpx_client=httpx_client
+            httpx_client = get_shared_client()
+            # Create the actual agent, or reuse one built for the same remotes
+            self.agent = await _get_shared_orchestrator_agent(
+                self.remote_agent_addresses, httpx_client
             )
 
             # The Runner orchestrates the agent execution
@@ -88,11 +126,38 @@ class AdkOrchestratorAgentExecutor(AgentExecutor):
                 agent=self.agent,
                 # In-memory services for simplicity
                 # In production, you might use persistent storage
-                artifact_service=InMemoryArtifactService(),
+                artifact_service=BoundedArtifactService(),
                 session_service=InMemorySessionService(),
                 memory_service=InMemoryMemoryService(),
             )
 
+    async def _ensure_initialized(self) -> None:
+        """Initialize the agent once, even with concurrent callers.
+
+        The lock keeps a request that arrives during warmup from building a
+        second runner.
+        """
+        async with self._init_lock:
+            if self.runner is None:
+                await self._init_agent()
+
+    def _schedule_warmup(self) -> asyncio.Task | None:
+        """Start warmup in the background if constructed inside an event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop yet; the first request initializes the agent instead
+            return None
+        task = loop.create_task(self._ensure_initialized())
+        task.add_done_callback(self._log_warmup_failure)
+        return task
+
+    @staticmethod
+    def _log_warmup_failure(task: asyncio.Task) -> None:
+        """Log a failed warmup; the first request retries the init."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Agent warmup failed: %s", task.exception())
+
     async def execute(
         self,
         context: RequestContext,
@@ -104,13 +169,13 @@ class AdkOrchestratorAgentExecutor(AgentExecutor):
         1. A new message arrives (message/send)
         2. A streaming request is made (message/stream)
         """
-        # Initialize agent on first call
-        if self.agent is None:
-            await self._init_agent()
+        # Initialize agent on first call unless warmup already did
+        if self.runner is None:
+            await self._ensure_initialized()
 
         # Extract the user's question from the protocol message
         query = context.get_user_input()
-        logging.info(f"Received query: {query}")
+        logger.info("Received query: %s", query)
 
         # Create a TaskUpdater for managing task state
         updater = TaskUpdater(event_queue, context.task_id, context.context_id)
@@ -127,10 +192,13 @@ class AdkOrchestratorAgentExecutor(AgentExecutor):
         try:
             # Get or create a session for this conversation
             session = await self._get_or_create_session(context.context_id)
-            logging.info(f"Using session: {session.id}")
+            logger.info("Using session: %s", session.id)
 
             # Prepare the user message in ADK format
-            content = types.Content(role=Role.user, parts=[types.Part(text=query)])
+            # Fields are already valid, so skip pydantic validation
+            content = types.Content.model_construct(
+                role=_USER_ROLE, parts=[types.Part.model_construct(text=query)]
+            )
 
             # Run the agent asynchronously
             # This may involve multiple LLM calls and tool uses
@@ -144,7 +212,7 @@ class AdkOrchestratorAgentExecutor(AgentExecutor):
                 if event.is_final_response():
                     # Extract the answer text from the response
                     answer = self._extract_answer(event)
-                    logging.info(f" {answer}")
+                    logger.info(" %s", answer)
 
                     # Add the answer as an artifact
                     # Artifacts are the "outputs" or "results" of a task
@@ -161,7 +229,7 @@ class AdkOrchestratorAgentExecutor(AgentExecutor):
         except Exception as e:
             # Errors should never pass silently (Zen of Python)
             # Always inform the client when something goes wrong
-            logging.error(f"Error during execution: {e!s}", exc_info=True)
+            logger.error("Error during execution: %s", e, exc_info=True)
             await updater.update_status(
                 TaskState.failed, message=new_agent_text_message(f"Error: {e!s}")
             )
@@ -169,32 +237,40 @@ class AdkOrchestratorAgentExecutor(AgentExecutor):
             raise
 
     async def _get_or_create_session(self, context_id: str):
-        """Get existing session or create new one."""
-        session = await self.runner.session_service.get_session(
-            app_name=self.runner.app_name,
-            user_id="user",
-            session_id=context_id,
-        )
+        """Get existing session or create new one.
+
+        Sessions are cached per context, so follow-up turns skip the
+        session service lookup. The runner reloads the session by ID on every
+        run, so a cached object never serves stale events.
+        """
 
-        if not session:
-            logging.info(f"No session found for {context_id}, creating new one.")
-            session = await self.runner.session_service.create_session(
+        async def create() -> Session:
+            session = await self.runner.session_service.get_session(
                 app_name=self.runner.app_name,
                 user_id="user",
                 session_id=context_id,
             )
-        else:
-            logging.info(f"Found existing session {context_id}.")
 
-        return session
+            if not session:
+                logger.info("No session found for %s, creating new one.", context_id)
+                session = await self.runner.session_service.create_session(
+                    app_name=self.runner.app_name,
+                    user_id="user",
+                    session_id=context_id,
+                )
+            else:
+                logger.info("Found existing session %s.", context_id)
+            return session
+
+        return await self._sessions.get_or_create(context_id, create)
 
     def _extract_answer(self, event) -> str:
         """Extract text answer from agent response."""
         parts = event.content.parts
-        text_parts = [part.text for part in parts if part.text]
 
         # Join all text parts with space
-        return " ".join(text_parts) if text_parts else "No answer found."
+        answer = " ".join(filter(None, (part.text for part in parts)))
+        return answer or "No answer found."
 
     async def cancel(self, context: RequestContext, event_queue: EventQueue) -> NoReturn:
         """Handle task cancellation requests.
@@ -204,6 +280,8 @@ class AdkOrchestratorAgentExecutor(AgentExecutor):
         2. Clean up resources
         3. Update task state to 'cancelled'
         """
-        logging.warning(f"Cancellation requested for task {context.task_id}, but not supported.")
+        logger.warning(
+            "Cancellation requested for task %s, but not supported.", context.task_id
+        )
         # Inform client that cancellation isn't supported
         raise ServerError(error=UnsupportedOperationError())
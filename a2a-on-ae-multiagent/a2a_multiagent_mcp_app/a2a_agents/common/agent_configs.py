@@ -14,27 +14,36 @@
 # Author: Dave Wang
 """Agent configuration definitions.
 
-This module contains configuration dictionaries for different agent types.
+This module contains configuration mappings for different agent types.
 Each configuration defines the agent's name, description, instruction, and MCP settings.
+The mappings are read-only views, so callers can share them without copying.
 """
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
+COCKTAIL_AGENT_INSTRUCTION = """You are a specialized cocktail expert. Your primary function is to utilize the provided tools to retrieve and relay cocktail information in response to user queries. You can handle all inquiries related to cocktails,
+drink recipes, ingredients,and mixology.You must rely exclusively on these tools for data and refrain from inventing information. Ensure that all responses include the detailed output from the tools used and are formatted in Markdown"""
 
-COCKTAIL_AGENT_CONFIG: Dict = {
-    "name": "cocktail_agent",
-    "description": "An agent that can help questions about cocktail",
-    "instruction": """You are a specialized cocktail expert. Your primary function is to utilize the provided tools to retrieve and relay cocktail information in response to user queries. You can handle all inquiries related to cocktails,
-drink recipes, ingredients,and mixology.You must rely exclusively on these tools for data and refrain from inventing information. Ensure that all responses include the detailed output from the tools used and are formatted in Markdown""",
-    "model": "gemini-2.5-flash",
-    "mcp_url_env_var": "CT_MCP_SERVER_URL",
-}
+COCKTAIL_AGENT_CONFIG: Mapping[str, str] = MappingProxyType(
+    {
+        "name": "cocktail_agent",
+        "description": "An agent that can help questions about cocktail",
+        "instruction": COCKTAIL_AGENT_INSTRUCTION,
+        "model": "gemini-2.5-flash",
+        "mcp_url_env_var": "CT_MCP_SERVER_URL",
+    }
+)
 
 
-WEATHER_AGENT_CONFIG: Dict = {
-    "name": "weather_agent",
-    "description": "An agent that can help questions about weather",
-    "instruction": """You are a specialized weather forecast assistant. Your primary function is to utilize the provided tools to retrieve and relay weather information in response to user queries. You must rely exclusively on these tools for data and refrain from inventing information. Ensure that all responses include the detailed output from the tools used and are formatted in Markdown""",
-    "model": "gemini-2.5-flash",
-    "mcp_url_env_var": "WEA_MCP_SERVER_URL",
-}
+WEATHER_AGENT_INSTRUCTION = """You are a specialized weather forecast assistant. Your primary function is to utilize the provided tools to retrieve and relay weather information in response to user queries. You must rely exclusively on these tools for data and refrain from inventing information. Ensure that all responses include the detailed output from the tools used and are formatted in Markdown"""
+
+WEATHER_AGENT_CONFIG: Mapping[str, str] = MappingProxyType(
+    {
+        "name": "weather_agent",
+        "description": "An agent that can help questions about weather",
+        "instruction": WEATHER_AGENT_INSTRUCTION,
+        "model": "gemini-2.5-flash",
+        "mcp_url_env_var": "WEA_MCP_SERVER_URL",
+    }
+)
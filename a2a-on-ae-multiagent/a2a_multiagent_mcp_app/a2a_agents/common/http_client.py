@@ -0,0 +1,44 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Process-wide authenticated httpx client for calls to remote A2A agents."""
+
+import httpx
+
+from common.auth_utils import GoogleAuth
+
+# Connection pool bounds for the shared client
+SHARED_CLIENT_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+_shared_client: httpx.AsyncClient | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Returns the shared authenticated httpx client, creating it on first use.
+
+    Every executor in the process sends through this one client, so
+    connections to the same Vertex AI / A2A hosts are pooled and kept alive
+    instead of each executor paying its own TLS handshakes.
+
+    Returns:
+        An httpx.AsyncClient with Google Cloud auth and a bounded connection pool.
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(120.0, connect=10.0),
+            limits=SHARED_CLIENT_LIMITS,
+            auth=GoogleAuth(),
+            headers={"Content-Type": "application/json"},
+        )
+    return _shared_client
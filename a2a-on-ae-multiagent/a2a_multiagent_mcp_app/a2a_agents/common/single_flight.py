@@ -0,0 +1,69 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Sharing of identical in-flight calls."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Runs a call once for all callers that ask for it while it is running.
+
+    The model sometimes issues the same tool call twice in one turn; the
+    repeat joins the call that is still running instead of doing the work
+    again. Once a call finishes, the next caller with its key starts afresh.
+
+    Example:
+        >>> result = await self._single_flight.run(key, send_and_convert)
+    """
+
+    def __init__(self) -> None:
+        """Initializes the SingleFlight."""
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Runs call, or joins the running call with the same key.
+
+        Args:
+            key: Identifies identical calls.
+            call: Produces the result when no identical call is running.
+
+        Returns:
+            The result of call, shared with every caller that joined it.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.info("Joining in-flight call")
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await call()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unjoined failure isn't reported as unhandled
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
@@ -13,13 +13,13 @@
 # limitations under the License.
 # Author: Dave Wang
 from common.adk_orchestrator_agent_executor import AdkOrchestratorAgentExecutor
-import logging
 import os
-from dotenv import load_dotenv
 
-# Set logging
-logging.getLogger().setLevel(logging.INFO)
-load_dotenv()
+# Remote agent addresses, resolved once at import; common has already loaded .env
+REMOTE_AGENT_ADDRESSES: tuple[str, ...] = (
+    os.getenv("CT_AGENT_URL", "http://localhost:10002"),
+    os.getenv("WEA_AGENT_URL", "http://localhost:10001"),
+)
 
 
 class HostingAgentExecutor(AdkOrchestratorAgentExecutor):
@@ -31,8 +31,4 @@ class HostingAgentExecutor(AdkOrchestratorAgentExecutor):
 
     def __init__(self) -> None:
         """Initialize with remote agent addresses from environment variables."""
-        remote_agent_addresses = [
-            os.getenv("CT_AGENT_URL", "http://localhost:10002"),
-            os.getenv("WEA_AGENT_URL", "http://localhost:10001"),
-        ]
-        super().__init__(remote_agent_addresses=remote_agent_addresses)
+        super().__init__(remote_agent_addresses=list(REMOTE_AGENT_ADDRESSES))
@@ -13,21 +13,15 @@
 # limitations under the License.
 # Author: Dave Wang
 
-import logging
-from typing import Dict
-from dotenv import load_dotenv
+from typing import Mapping
 
 from common.agent_configs import WEATHER_AGENT_CONFIG
 from common.adk_base_mcp_agent_executor import AdkBaseMcpAgentExecutor
 
-# Set logging
-logging.getLogger().setLevel(logging.INFO)
-load_dotenv()
-
 
 class WeatherAgentExecutor(AdkBaseMcpAgentExecutor):
     """Agent Executor for weather-related queries using MCP tools."""
 
-    def get_agent_config(self) -> Dict:
+    def get_agent_config(self) -> Mapping[str, str]:
         """Return weather agent configuration."""
         return WEATHER_AGENT_CONFIG
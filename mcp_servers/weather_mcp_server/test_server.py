@@ -17,22 +17,33 @@ import asyncio
 
 from fastmcp import Client
 
+# Test the MCP server using streamable-http transport.
+# Use "/sse" endpoint if using sse transport.
+MCP_SERVER_URL = "http://localhost:8080/mcp"
+
+
+async def run_checks(client: Client):
+    """Runs the checks over an already-connected client.
+
+    Taking the client as an argument lets several checks share one MCP
+    session instead of paying the initialize handshake for each.
+    """
+    # Independent requests share the session, so send them together
+    tools, result = await asyncio.gather(
+        client.list_tools(),
+        client.call_tool("get_forecast_by_city", {"city": "New York", "state": "NY"}),
+    )
+    # List available tools
+    for tool in tools:
+        print(f">>> 🛠️  Tool found: {tool.name}")
+    print(f"<<< ✅ Result: {result[0].text}")
+
 
 async def test_server():
     """Tests the MCP server."""
-    # Test the MCP server using streamable-http transport.
-    # Use "/sse" endpoint if using sse transport.
-    async with Client("http://localhost:8080/mcp") as client:
-        # List available tools
-        tools = await client.list_tools()
-        for tool in tools:
-            print(f">>> 🛠️  Tool found: {tool.name}")
-        # Call add tool
-        result = await client.call_tool(
-            "get_forecast_by_city", {"city": "New York", "state": "NY"}
-        )
-        print(f"<<< ✅ Result: {result[0].text}")
+    async with Client(MCP_SERVER_URL) as client:
+        await run_checks(client)
 
 
 if __name__ == "__main__":
-    asyncio.run(test_server())
\ No newline at end of file
+    asyncio.run(test_server())